@@ -0,0 +1,113 @@
+"""
+Compare the extraction of the lyrics from a song page parsing the whole page
+(html.parser + recursive walk) against genius.scraper._parse_lyrics, and show
+how much of the page is read when streaming it.
+
+Usage: python -m benchmarks.lyrics [repetitions]
+"""
+
+import sys
+import timeit
+from typing import List
+
+from bs4 import BeautifulSoup, NavigableString
+
+from genius.scraper import (
+    CHUNK_SIZE,
+    LYRICS_CONTAINER,
+    PARSER,
+    _parse_lyrics,
+    _read_lyrics_html,
+)
+
+
+def legacy_lyrics(page: str) -> List[str]:
+    """
+    Lines of the lyrics extracted like the scraper used to: parsing the whole
+    page with html.parser and walking the lyrics containers recursively.
+    """
+
+    def extract(current) -> List[str]:
+        if type(current) is NavigableString:
+            return [str(current)]
+
+        if current.name == "br":
+            return ["\n"]
+
+        strings = []
+
+        for children in current.children:
+            strings += extract(children)
+
+        return strings
+
+    soup = BeautifulSoup(page, features="html.parser")
+    lyrics = []
+
+    for div in soup.find_all("div", attrs=LYRICS_CONTAINER):
+        lyrics += extract(div)
+
+    return "".join(lyrics).replace("е", "e").split("\n")
+
+
+def song_page(verses: int = 8, lines: int = 8, filler: int = 400) -> str:
+    """
+    Synthetic song page shaped like the ones of genius.com: lots of markup and
+    scripts around a few lyrics containers with annotated lines.
+    """
+    rows = [
+        f'<div class="SongHeader__Row"><a href="/tags/{index}"><span>Tag {index}'
+        "</span></a></div>"
+        for index in range(filler)
+    ]
+    markup = "".join(rows)
+    sidebar = "".join(rows[:20])
+    script = "<script>window.__STATE__ = {%s};</script>" % ",".join(
+        f'"key{index}": "{"x" * 80}"' for index in range(filler)
+    )
+
+    containers = []
+
+    for verse in range(verses):
+        body = "<br/>".join(
+            f'<a class="ReferentFragment" href="/{verse}-{line}">'
+            f"<span><i>Line {line}</i> of <b>verse {verse}</b></span></a>"
+            for line in range(lines)
+        )
+        containers.append(
+            f'<div data-lyrics-container="true">[Verse {verse}]<br/>{body}</div>'
+            f'<div class="RightSidebar">{sidebar}</div>'
+        )
+
+    return (
+        f"<html><head>{script}</head><body>{markup}"
+        f'<div id="lyrics-root">{"".join(containers)}</div>'
+        f"{markup}{script}</body></html>"
+    )
+
+
+def main(repetitions: int) -> None:
+    page = song_page()
+
+    assert _parse_lyrics(page) == legacy_lyrics(page)
+
+    full = timeit.timeit(lambda: legacy_lyrics(page), number=repetitions)
+    fast = timeit.timeit(lambda: _parse_lyrics(page), number=repetitions)
+
+    print(f"page size: {len(page) / 1024:.0f} KiB, parser: {PARSER}")
+    print(f"full parse: {full / repetitions * 1000:.2f} ms/page")
+    print(f"fast parse: {fast / repetitions * 1000:.2f} ms/page")
+    print(f"speedup: {full / fast:.1f}x")
+
+    chunks = (
+        page[start : start + CHUNK_SIZE] for start in range(0, len(page), CHUNK_SIZE)
+    )
+    streamed = _read_lyrics_html(chunks)
+
+    assert _parse_lyrics(streamed) == _parse_lyrics(page)
+
+    print(f"streamed: read {len(streamed) / 1024:.0f} KiB of the page")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,122 @@
+"""
+Measure the memory used by the models of a catalog of songs built from the
+responses of the api (each one with its own artist, album and media), before
+and after reading all their details.
+
+Usage: python -m benchmarks.memory [songs]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from genius.api import Genius
+
+RELATIONSHIPS = [
+    "samples",
+    "sampled_in",
+    "interpolates",
+    "interpolated_by",
+    "cover_of",
+    "covered_by",
+    "remix_of",
+    "remixed_by",
+    "live_version_of",
+    "performed_live_as",
+]
+
+
+def song_payload(song_id: int) -> dict:
+    artist = {
+        "id": song_id,
+        "name": f"Artist {song_id}",
+        "url": f"https://genius.com/artists/{song_id}",
+        "image_url": f"https://images.genius.com/{song_id}.png",
+    }
+
+    return {
+        "id": song_id,
+        "title": f"Song {song_id}",
+        "title_with_featured": f"Song {song_id}",
+        "url": f"https://genius.com/songs/{song_id}",
+        "song_art_image_url": f"https://images.genius.com/songs/{song_id}.png",
+        "stats": {"hot": False, "pageviews": song_id},
+        "primary_artist": artist,
+        "album": {
+            "id": song_id,
+            "name": f"Album {song_id}",
+            "url": f"https://genius.com/albums/{song_id}",
+            "artist": artist,
+        },
+        "release_date": "2017-03-23",
+        "release_date_for_display": "March 23, 2017",
+        "description": {"plain": "?"},
+        "media": [
+            {"provider": "youtube", "type": "video", "url": f"https://y.com/{song_id}"}
+        ],
+        "primary_artists": [artist],
+        "song_relationships": [
+            {"type": relationship, "songs": []} for relationship in RELATIONSHIPS
+        ],
+    }
+
+
+def details(song) -> None:
+    # The payloads include all the details, as the ones returned by get_song.
+    song._fully_loaded_ = True
+
+    for name in ["album", "media", "release_date", "artists"] + RELATIONSHIPS:
+        getattr(song, name)
+
+
+def build(genius: Genius, songs: int) -> list:
+    # The payloads are only referenced by the models built from them, so the
+    # raw data they keep is measured too.
+    return [genius._song(song_payload(song_id)) for song_id in range(1, songs + 1)]
+
+
+def main(songs: int) -> None:
+    genius = Genius("token")
+    started = time.perf_counter()
+    catalog = build(genius, songs)
+    elapsed = time.perf_counter() - started
+
+    del catalog
+    genius = Genius("token")
+
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+
+    catalog = build(genius, songs)
+
+    gc.collect()
+    built, _ = tracemalloc.get_traced_memory()
+
+    for song in catalog:
+        details(song)
+
+    gc.collect()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    song = catalog[0]
+
+    print(
+        f"songs: {len(catalog)}, built with their payloads in {elapsed * 1000:.0f} ms"
+    )
+    print(f"bytes per song: {(built - start) / songs:.0f}")
+    print(f"bytes per song with all its details: {(end - start) / songs:.0f}")
+
+    for instance in [song, song.artist, song.album]:
+        size = sys.getsizeof(instance)
+
+        if hasattr(instance, "__dict__"):
+            size += sys.getsizeof(instance.__dict__)
+
+        print(f"{type(instance).__name__} instance: {size} bytes")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
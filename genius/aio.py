@@ -0,0 +1,701 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple
+
+try:
+    import aiohttp
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "genius.aio requires aiohttp, install it with: pip install wrap-genius[async]"
+    ) from exc
+
+from genius.api import API, SortingKeys
+from genius.cache import Cache, CacheBackend
+from genius.classes import Album, Artist, Song
+from genius.classes.commons import IdentityMap
+from genius.exceptions import APIException
+from genius.ratelimit import THROTTLING_STATUSES, RateLimiter, retry_after
+from genius.retry import RETRYABLE_EXCEPTIONS, RetryPolicy
+from genius.scraper import (
+    LYRICS_SERVICE,
+    _conditional_headers,
+    _lyrics_entry,
+    _parse_lyrics,
+    _save_lyrics,
+)
+from genius.session import DEFAULT_TIMEOUT
+from genius.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_AIOHTTP_EXCEPTIONS = (
+    *RETRYABLE_EXCEPTIONS,
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+)
+
+
+def _client_timeout(
+    timeout: float | Tuple[float, float] | None,
+) -> aiohttp.ClientTimeout:
+    if timeout is None:
+        return aiohttp.ClientTimeout(total=None)
+
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect = read = timeout
+
+    return aiohttp.ClientTimeout(total=None, connect=connect, sock_read=read)
+
+
+def _awaitable(lazy: property) -> property:
+    prop = lazy.fget.__wrapped__
+
+    @property
+    def wrapper(self):
+        async def load():
+            await self.load()
+            return prop(self)
+
+        return load()
+
+    return wrapper
+
+
+async def _get_page(
+    url: str, session: aiohttp.ClientSession, headers: Dict[str, str]
+) -> Tuple[int, Mapping[str, str], str]:
+    async with session.get(url, headers=headers, raise_for_status=True) as response:
+        return response.status, response.headers, await response.text()
+
+
+async def get_lyrics(
+    url: str,
+    session: aiohttp.ClientSession,
+    retry: Optional[RetryPolicy] = None,
+    cache: Optional[Cache] = None,
+) -> List[str]:
+    """
+    Looks for the lyrics of a song in genius.
+
+    When a cache is provided the lines are stored in it, and once they expire
+    (after a week, when the cache has no ttl for them) the page is requested
+    again with its ETag / Last-Modified, so an unchanged page is neither
+    downloaded nor parsed again. Pages without lyrics aren't cached.
+
+    Parameters
+    ----------
+    url: str
+        Url of the song in genius.
+    session: aiohttp.ClientSession
+        Http session to reuse the connections from.
+    retry: genius.retry.RetryPolicy
+        Policy to retry the requests that fail with transient errors.
+    cache: genius.cache.Cache
+        Cache where the lyrics are stored.
+
+    Returns
+    -------
+    List[str]:
+        Lines of the lyrics.
+    """
+    retry = retry or RetryPolicy(exceptions=RETRYABLE_AIOHTTP_EXCEPTIONS)
+    cache = cache or Cache()
+
+    cached, expired = cache.lookup(LYRICS_SERVICE, url=url)
+
+    if cached and not expired:
+        return cached["lines"]
+
+    try:
+        status, headers, content = await retry.call_async(
+            _get_page, url, session, _conditional_headers(cached)
+        )
+
+        if cached and status == 304:
+            entry = cached
+        else:
+            entry = _lyrics_entry(_parse_lyrics(content), headers)
+    except Exception as exc:
+        logger.error("Failed to fetch lyrics: %s", exc)
+        return cached["lines"] if cached else []
+
+    _save_lyrics(cache, url, entry)
+
+    return entry["lines"]
+
+
+class AsyncAPI:
+    BASE_URL = "https://api.genius.com"
+
+    def __init__(
+        self,
+        access_token: str,
+        cache_path: str | None = None,
+        session: aiohttp.ClientSession | None = None,
+        limit: int = 100,
+        cache_backend: CacheBackend | None = None,
+        cache_ttl: float | Dict[str, float] | None = None,
+        rate_limit: float | None = None,
+        retry: RetryPolicy | None = None,
+        timeout: float | Tuple[float, float] | None = DEFAULT_TIMEOUT,
+    ):
+        assert access_token
+
+        self.access_token: str = f"Bearer {access_token}"
+        self.cache: Cache = Cache(cache_path, backend=cache_backend, ttl=cache_ttl)
+        self.limiter: RateLimiter = RateLimiter(rate_limit)
+        self.retry: RetryPolicy = retry or RetryPolicy(
+            exceptions=RETRYABLE_AIOHTTP_EXCEPTIONS
+        )
+
+        self.limit: int = limit
+        self.timeout: float | Tuple[float, float] | None = timeout
+        self.flights: SingleFlight = SingleFlight()
+        self._owns_session: bool = session is None
+        self._session: aiohttp.ClientSession | None = session
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # aiohttp sessions have to be created from within a running event loop.
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit),
+                timeout=_client_timeout(self.timeout),
+            )
+
+        return self._session
+
+    async def close(self) -> None:
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __call__(self, service: str, **params) -> dict[str, Any]:
+        params = API.params(**params)
+
+        if cached := self.cache.load(service, **params):
+            return cached
+
+        # Concurrent callers of the same request share a single fetch.
+        return await self.flights.call_async(
+            Cache.key(service, **params),
+            self.retry.call_async,
+            self.fetch,
+            service,
+            **params,
+        )
+
+    async def fetch(self, service: str, **params) -> dict[str, Any]:
+        if delay := self.limiter.reserve():
+            await asyncio.sleep(delay)
+
+        async with self.session.get(
+            url=f"{self.BASE_URL}/{service}",
+            params={key: str(value) for key, value in params.items()},
+            headers={
+                "Authorization": self.access_token,
+            },
+        ) as response:
+            try:
+                data = await response.json(content_type=None)
+            except ValueError:
+                data = {}
+
+        if response.status in THROTTLING_STATUSES:
+            self.limiter.throttled(retry_after(response.headers.get("Retry-After")))
+        else:
+            self.limiter.succeeded()
+
+        meta = API.meta(data, response.status, response.reason)
+
+        if meta["status"] != 200:
+            raise APIException(
+                status=meta["status"],
+                message=meta.get("message"),
+                url=str(response.url),
+            )
+
+        result = data["response"]
+
+        self.cache.save(service, result, **params)
+
+        return result
+
+    async def get_song(self, song_id: int) -> Optional[Dict]:
+        assert song_id
+
+        return (await self(service=f"songs/{song_id}")).get("song")
+
+    async def get_artist(self, artist_id: int) -> Optional[Dict]:
+        assert artist_id
+
+        return (await self(service=f"artists/{artist_id}")).get("artist")
+
+    async def get_artist_songs(
+        self,
+        artist_id: int,
+        page: int = 1,
+        per_page: int = 50,
+        sort: str = SortingKeys.TITLE,
+    ) -> List[Dict]:
+        assert artist_id
+        assert page > 0
+        assert 51 > per_page > 1
+        assert sort in list(SortingKeys)
+
+        result = await self(
+            service=f"artists/{artist_id}/songs",
+            page=page,
+            per_page=per_page,
+            sort=sort,
+        )
+
+        return result.get("songs", [])
+
+    async def get_album_songs(
+        self,
+        album_id: int,
+        page: int = 1,
+        per_page: int = 50,
+    ) -> List[Dict]:
+        assert album_id
+        assert page > 0
+        assert 51 > per_page > 1
+
+        result = await self(
+            service=f"albums/{album_id}/tracks",
+            page=page,
+            per_page=per_page,
+        )
+
+        return result.get("tracks", [])
+
+    async def search(self, text: str, page: int = 1, per_page: int = 20) -> List[Dict]:
+        assert text
+        assert page > 0
+        assert 21 > per_page > 1
+
+        result = await self("search", q=text, page=page, per_page=per_page)
+
+        return [hit["result"] for hit in result.get("hits", [])]
+
+
+class AsyncArtist(Artist):
+    """
+    Artist returned by genius.aio.AsyncGenius.
+
+    note:
+        **the attributes marked with a * are awaitables, and will trigger one
+        extra call to the api the first time one of them is awaited.**
+    """
+
+    __slots__ = ()
+
+    async def load(self) -> "AsyncArtist":
+        if not self._fully_loaded_:
+            data = await self.genius.api.get_artist(self.id)
+            self.__init_extra_data__(data)
+            self._fully_loaded_ = True
+
+        return self
+
+    alternate_names = _awaitable(Artist.alternate_names)
+    description = _awaitable(Artist.description)
+    followers_count = _awaitable(Artist.followers_count)
+    social_media = _awaitable(Artist.social_media)
+
+    @property
+    async def songs(self) -> AsyncIterator["AsyncSong"]:
+        async for song in self.genius.get_all_artist_songs(self.id):
+            yield song
+
+    @property
+    async def songs_by_popularity(self) -> AsyncIterator["AsyncSong"]:
+        async for song in self.genius.get_all_artist_songs(self.id, sort="popularity"):
+            yield song
+
+
+class AsyncAlbum(Album):
+    __slots__ = ()
+
+    @property
+    async def songs(self) -> AsyncIterator["AsyncSong"]:
+        async for song in self.genius.get_all_album_songs(self.id):
+            yield song
+
+
+class AsyncSong(Song):
+    """
+    Song returned by genius.aio.AsyncGenius.
+
+    note:
+        **the attributes marked with a * are awaitables, and will trigger one
+        extra call to the api the first time one of them is awaited.**
+    """
+
+    __slots__ = ()
+
+    async def load(self) -> "AsyncSong":
+        if not self._fully_loaded_:
+            data = await self.genius.api.get_song(self.id)
+            self.__init_extra_data__(data)
+            self._fully_loaded_ = True
+
+        return self
+
+    description = _awaitable(Song.description)
+    recording_location = _awaitable(Song.recording_location)
+    release_date = _awaitable(Song.release_date)
+    release_date_for_display = _awaitable(Song.release_date_for_display)
+    album = _awaitable(Song.album)
+    media = _awaitable(Song.media)
+    artists = _awaitable(Song.artists)
+    features = _awaitable(Song.features)
+    producers = _awaitable(Song.producers)
+    writers = _awaitable(Song.writers)
+    samples = _awaitable(Song.samples)
+    sampled_in = _awaitable(Song.sampled_in)
+    interpolates = _awaitable(Song.interpolates)
+    interpolated_by = _awaitable(Song.interpolated_by)
+    cover_of = _awaitable(Song.cover_of)
+    covered_by = _awaitable(Song.covered_by)
+    remix_of = _awaitable(Song.remix_of)
+    remixed_by = _awaitable(Song.remixed_by)
+    live_version_of = _awaitable(Song.live_version_of)
+    performed_live_as = _awaitable(Song.performed_live_as)
+
+    @property
+    async def is_cover(self) -> bool:
+        return len(await self.cover_of) > 0
+
+    @property
+    async def is_live(self) -> bool:
+        return len(await self.live_version_of) > 0
+
+    @property
+    async def is_remix(self) -> bool:
+        return len(await self.remix_of) > 0
+
+    @property
+    async def lyrics(self) -> List[str]:
+        """
+        Fetch the lyrics of the song using a scraper.
+
+        Returns
+        -------
+        List[str]
+            Lines of the lyrics.
+        """
+        return await get_lyrics(
+            self.url,
+            self.genius.api.session,
+            retry=self.genius.api.retry,
+            cache=self.genius.api.cache,
+        )
+
+
+class AsyncGenius:
+    """
+    Asyncio version of genius.api.Genius.
+
+    Methods that return a single object are coroutines, and methods that return
+    several objects are async generators.
+    """
+
+    def __init__(
+        self,
+        access_token: str,
+        cache_path: str | None = None,
+        session: aiohttp.ClientSession | None = None,
+        limit: int = 100,
+        cache_backend: CacheBackend | None = None,
+        cache_ttl: float | Dict[str, float] | None = None,
+        rate_limit: float | None = None,
+        retry: RetryPolicy | None = None,
+        timeout: float | Tuple[float, float] | None = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        access_token: str
+            Client access token of the genius api.
+        cache_path: str
+            Directory where the responses of the api will be cached.
+        session: aiohttp.ClientSession
+            Http session to use, it won't be closed by this client.
+        limit: int
+            Maximum amount of simultaneous connections.
+        cache_backend: genius.cache.CacheBackend
+            Backend where the responses of the api will be cached (overrides
+            cache_path).
+        cache_ttl: float | Dict[str, float]
+            Seconds the cached responses are valid for, globally or per service
+            pattern (e.g. {"search": 3600, "songs/*": 604800}).
+        rate_limit: float
+            Maximum requests per second to the api, reduced automatically while
+            the api throttles the requests, and unlimited if not set.
+        retry: genius.retry.RetryPolicy
+            Policy to retry the requests of the api and the scraper that fail
+            with transient errors (3 attempts with exponential backoff by default).
+        timeout: float | Tuple[float, float]
+            Seconds to wait for the api and the lyrics pages, either one value or
+            a (connect, read) tuple, or None to wait forever. It only applies to
+            the sessions created by the client.
+        """
+        self.api = AsyncAPI(
+            access_token,
+            cache_path=cache_path,
+            session=session,
+            limit=limit,
+            cache_backend=cache_backend,
+            cache_ttl=cache_ttl,
+            rate_limit=rate_limit,
+            retry=retry,
+            timeout=timeout,
+        )
+        self.identity: IdentityMap = IdentityMap(self)
+
+    async def __aenter__(self) -> "AsyncGenius":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the connections opened by the client.
+        """
+        await self.api.close()
+
+    def _song(self, data: Dict, full: bool = False) -> AsyncSong:
+        return self.identity.get(AsyncSong, data, full)
+
+    def _artist(self, data: Dict, full: bool = False) -> AsyncArtist:
+        return self.identity.get(AsyncArtist, data, full)
+
+    def _album(self, data: Dict) -> AsyncAlbum:
+        return self.identity.get(AsyncAlbum, data)
+
+    async def get_song(self, song_id: int) -> AsyncSong:
+        """
+        Retrieve the information of a song.
+
+        Parameters
+        ----------
+        song_id: int
+            ID of the song.
+
+        Returns
+        -------
+        genius.aio.AsyncSong
+        """
+        return self._song(await self.api.get_song(song_id), full=True)
+
+    async def get_artist(self, artist_id: int) -> AsyncArtist:
+        """
+        Retrieve the information of an artist.
+
+        Parameters
+        ----------
+        artist_id: int
+            ID of the artist.
+
+        Returns
+        -------
+        genius.aio.AsyncArtist
+        """
+        return self._artist(await self.api.get_artist(artist_id), full=True)
+
+    async def get_artist_songs(
+        self,
+        artist_id: int,
+        page: int = 1,
+        per_page: int = 50,
+        sort: str = SortingKeys.TITLE,
+    ) -> AsyncIterator[AsyncSong]:
+        """
+        Retrieve the songs of an artist.
+
+        Parameters
+        ----------
+        artist_id: int
+            ID of the artist.
+        page: int
+            Desired page.
+        per_page: int
+            Amount of songs per page.
+        sort: string
+            Sort key for the songs (title/popularity).
+
+        Yields
+        -------
+        genius.aio.AsyncSong
+            Song of the artist.
+        """
+        for song in await self.api.get_artist_songs(artist_id, page, per_page, sort):
+            yield self._song(song)
+
+    async def get_album_songs(
+        self,
+        album_id: int,
+        page: int = 1,
+        per_page: int = 50,
+    ) -> AsyncIterator[AsyncSong]:
+        """
+        Retrieve the songs of an album.
+
+        Parameters
+        ----------
+        album_id: int
+            ID of the album.
+        page: int
+            Desired page.
+        per_page: int
+            Amount of songs per page.
+
+        Yields
+        -------
+        genius.aio.AsyncSong
+            Song of the album.
+        """
+        for track in await self.api.get_album_songs(album_id, page, per_page):
+            yield self._song(track["song"])
+
+    async def get_all_artist_songs(
+        self, artist_id: int, sort: str = "title"
+    ) -> AsyncIterator[AsyncSong]:
+        """
+        Retrieve the all the songs of an artist.
+
+        Parameters
+        ----------
+        artist_id: int
+            ID of the artist.
+        sort: string
+            Sort key for the songs (title/popularity).
+
+        Yields
+        -------
+        genius.aio.AsyncSong
+            Song of the artist.
+        """
+        page = 0
+
+        while True:
+            page += 1
+            songs = await self.api.get_artist_songs(artist_id, page=page, sort=sort)
+
+            if not songs:
+                break
+
+            for song in songs:
+                yield self._song(song)
+
+    async def get_all_album_songs(self, album_id: int) -> AsyncIterator[AsyncSong]:
+        """
+        Retrieve the all the songs of an album.
+
+        Parameters
+        ----------
+        album_id: int
+            ID of the album.
+
+        Yields
+        -------
+        genius.aio.AsyncSong
+            Song of the album.
+        """
+        page = 0
+
+        while True:
+            page += 1
+            tracks = await self.api.get_album_songs(album_id, page=page)
+
+            if not tracks:
+                break
+
+            for track in tracks:
+                yield self._song(track["song"])
+
+    async def search(
+        self, text: str, page: int = 1, per_page: int = 20
+    ) -> AsyncIterator[AsyncSong]:
+        """
+        Search for songs that match with the provided text.
+
+        Parameters
+        ----------
+        text: str
+            Text to search.
+        page: int
+            Desired page.
+        per_page: int
+            Amount of songs per page.
+
+        Yields
+        -------
+        genius.aio.AsyncSong
+            Song that matches the search text.
+        """
+        for song in await self.api.search(text=text, page=page, per_page=per_page):
+            yield self._song(song)
+
+    async def search_all(
+        self, text: str, page_limit: int = 10
+    ) -> AsyncIterator[AsyncSong]:
+        """
+        Search for all the songs that match with the provided text.
+
+        Parameters
+        ----------
+        text: str
+            Text to search.
+        page_limit: int
+            Limit of pages in the search.
+
+        Yields
+        -------
+        genius.aio.AsyncSong
+            Song that matches the search text.
+        """
+        page = 0
+
+        while True:
+            page += 1
+
+            if page_limit and page > page_limit:
+                break
+
+            songs = await self.api.search(text, page=page)
+
+            if not songs:
+                break
+
+            for song in songs:
+                yield self._song(song)
+
+    async def search_artist(self, name: str) -> Optional[AsyncArtist]:
+        """
+        Search for an artist that match with the provided text.
+
+        Parameters
+        ----------
+        name: str
+            Name of the artist to search.
+
+        Returns
+        -------
+        genius.aio.AsyncArtist
+            Artist that matches the search.
+        """
+        name = name.lower()
+
+        async for song in self.search_all(name):
+            artist = song.artist
+
+            if name == artist.name.lower():
+                return artist
+
+        return None
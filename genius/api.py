@@ -1,12 +1,35 @@
-import json
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import requests
 
-from genius.classes import Artist, Song
+from genius.bulk import ErrorHandler, fetch_many
+from genius.cache import Cache, CacheBackend
+from genius.classes import Album, Artist, Song
+from genius.classes.commons import IdentityMap
 from genius.exceptions import APIException
+from genius.graph import RELATIONSHIPS, Edge, EdgeStore, crawl
+from genius.index import SearchIndex, SearchSource
+from genius.pagination import paginate
+from genius.ratelimit import THROTTLING_STATUSES, RateLimiter, retry_after
+from genius.resolver import ArtistResolver
+from genius.results import ResultMode, project
+from genius.retry import RetryPolicy
+from genius.scraper import _parse_lyrics, get_lyrics
+from genius.session import DEFAULT_TIMEOUT, create_session
+from genius.singleflight import SingleFlight
 
 
 class SortingKeys(str, Enum):
@@ -19,79 +42,118 @@ class SortingKeys(str, Enum):
         return self.value
 
 
-class Cache:
-    def __init__(self, cache_path: str | None) -> None:
-        self.path: Path | None = Path(cache_path) if cache_path else None
-
-    def key(self, service: str, **params) -> str:
-        key = service
-
-        if page := params.get("page"):
-            key = f"{key}/{page}"
+class API:
+    BASE_URL = "https://api.genius.com"
 
-        return key
+    def __init__(
+        self,
+        access_token: str,
+        cache_path: str | None = None,
+        session: requests.Session | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        cache_backend: CacheBackend | None = None,
+        cache_ttl: float | Dict[str, float] | None = None,
+        rate_limit: float | None = None,
+        retry: RetryPolicy | None = None,
+        timeout: float | Tuple[float, float] | None = DEFAULT_TIMEOUT,
+        index: SearchIndex | None = None,
+    ):
+        assert access_token
 
-    def load(self, service: str, **params) -> dict[str, Any]:
-        if not self.path:
-            return None
+        self.access_token: str = f"Bearer {access_token}"
+        self.cache: Cache = Cache(cache_path, backend=cache_backend, ttl=cache_ttl)
+        self.limiter: RateLimiter = RateLimiter(rate_limit)
+        self.retry: RetryPolicy = retry or RetryPolicy()
+        self.timeout: float | Tuple[float, float] | None = timeout
+        self.flights: SingleFlight = SingleFlight()
+        self.index: SearchIndex | None = index
+
+        self._owns_session: bool = session is None
+        self.session: requests.Session = session or create_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+        )
 
-        key = self.key(service, **params)
-        path = self.path / f"{key}.json"
+    def close(self) -> None:
+        if self._owns_session:
+            self.session.close()
 
-        if not path.exists():
-            path.parent.mkdir(parents=True, exist_ok=True)
+    @staticmethod
+    def meta(data: dict[str, Any], status: int, reason: str) -> dict[str, Any]:
+        # Throttled and some failed requests don't include the meta of the api.
+        if meta := data.get("meta"):
+            return meta
 
-        try:
-            with open(path, "r") as file:
-                return json.load(file)
-        except FileNotFoundError:
-            pass
+        return {
+            "status": status,
+            "message": data.get("error_description") or reason,
+        }
 
-        return None
+    @staticmethod
+    def params(**params) -> dict[str, Any]:
+        return {**params, "text_format": "plain"}
 
-    def save(self, service: str, data: dict[str, Any], **params) -> None:
-        if not self.path:
-            return
+    def cached(self, service: str, **params) -> Optional[dict[str, Any]]:
+        return self._indexed(self.cache.load(service, **self.params(**params)))
 
-        key = self.key(service, **params)
-        path = self.path / f"{key}.json"
+    def _indexed(self, result: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+        # Cached responses are indexed too, so an index attached to a client
+        # with a warm cache gets the catalog that was already crawled.
+        if result and self.index is not None:
+            self.index.add(result)
 
-        if not path.exists():
-            path.parent.mkdir(parents=True, exist_ok=True)
+        return result
 
-        with open(path, "w+") as file:
-            json.dump(data, file, indent=2)
+    def __call__(self, service: str, **params) -> dict[str, Any]:
+        params = self.params(**params)
 
+        if cached := self._indexed(self.cache.load(service, **params)):
+            return cached
 
-class API:
-    BASE_URL = "https://api.genius.com"
+        # Concurrent callers of the same request share a single fetch.
+        key = Cache.key(service, **params)
 
-    def __init__(self, access_token: str, cache_path: str | None = None):
-        assert access_token
+        return self.flights.call(key, self._load, service, **params)
 
-        self.access_token: str = f"Bearer {access_token}"
-        self.cache: Cache = Cache(cache_path)
+    def _load(self, service: str, **params) -> dict[str, Any]:
+        with self.cache.locked(service, **params):
+            # Another process could have fetched it while waiting for the lock.
+            if cached := self._indexed(self.cache.load(service, **params)):
+                return cached
 
-    def __call__(self, service: str, **params) -> dict[str, Any]:
-        if cached := self.cache.load(service, **params):
-            return cached
+            return self.retry.call(self.fetch, service, **params)
 
-        params["text_format"] = "plain"
+    def fetch(self, service: str, **params) -> dict[str, Any]:
+        self.limiter.acquire()
 
-        response = requests.get(
+        response = self.session.get(
             url=f"{self.BASE_URL}/{service}",
             params=params,
             headers={
                 "Authorization": self.access_token,
             },
+            timeout=self.timeout,
         )
 
-        data = response.json()
+        if response.status_code in THROTTLING_STATUSES:
+            self.limiter.throttled(retry_after(response.headers.get("Retry-After")))
+        else:
+            self.limiter.succeeded()
 
-        if data["meta"]["status"] != 200:
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+
+        meta = self.meta(data, response.status_code, response.reason)
+
+        if meta["status"] != 200:
             raise APIException(
-                status=data["meta"]["status"],
-                message=data["meta"]["message"],
+                status=meta["status"],
+                message=meta.get("message"),
                 url=response.url,
             )
 
@@ -99,7 +161,7 @@ class API:
 
         self.cache.save(service, result, **params)
 
-        return result
+        return self._indexed(result)
 
     def get_song(self, song_id: int) -> Optional[Dict]:
         assert song_id
@@ -161,11 +223,169 @@ class API:
 
 
 class Genius:
-    def __init__(self, access_token: str, cache_path: str | None = None) -> None:
+    """
+    Client of the genius api, which builds the models of its responses.
+
+    A client can be shared by several threads (e.g. the workers of a
+    ThreadPoolExecutor): the session, the cache, the rate limit and the retry
+    counters are safe to use concurrently, each song, artist and album is
+    represented by a single object, and the attributes that trigger an extra
+    call to the api load each object once, with the rest of the threads waiting
+    for it instead of seeing it half loaded.
+    """
+
+    def __init__(
+        self,
+        access_token: str,
+        cache_path: str | None = None,
+        session: requests.Session | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        prefetch: int = 0,
+        cache_backend: CacheBackend | None = None,
+        cache_ttl: float | Dict[str, float] | None = None,
+        rate_limit: float | None = None,
+        retry: RetryPolicy | None = None,
+        timeout: float | Tuple[float, float] | None = DEFAULT_TIMEOUT,
+        deadline: float | None = None,
+        stream_lyrics: bool = False,
+        result_mode: ResultMode = ResultMode.MODEL,
+        search_index: SearchIndex | None = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        access_token: str
+            Client access token of the genius api.
+        cache_path: str
+            Directory where the responses of the api will be cached.
+        session: requests.Session
+            Http session to use, it won't be closed by this client.
+        pool_connections: int
+            Amount of hosts to keep a connection pool for.
+        pool_maxsize: int
+            Maximum amount of connections to keep open per host.
+        keep_alive: bool
+            Flag to indicate if the connections should be reused between requests.
+        prefetch: int
+            Default amount of pages to fetch ahead when iterating over all the pages
+            of a service (disabled by default).
+        cache_backend: genius.cache.CacheBackend
+            Backend where the responses of the api will be cached (overrides
+            cache_path).
+        cache_ttl: float | Dict[str, float]
+            Seconds the cached responses are valid for, globally or per service
+            pattern (e.g. {"search": 3600, "songs/*": 604800}).
+        rate_limit: float
+            Maximum requests per second to the api, shared by all the threads
+            using the client. It's reduced automatically while the api throttles
+            the requests, and it's unlimited if not set (the pauses requested by
+            the api with Retry-After are still honored).
+        retry: genius.retry.RetryPolicy
+            Policy to retry the requests of the api and the scraper that fail
+            with transient errors (3 attempts with exponential backoff by default).
+        timeout: float | Tuple[float, float]
+            Seconds to wait for the api and the lyrics pages, either one value or
+            a (connect, read) tuple, or None to wait forever.
+        deadline: float
+            Default seconds to iterate over all the pages of a service for, after
+            which a genius.exceptions.DeadlineExceeded is raised (disabled by
+            default).
+        stream_lyrics: bool
+            Flag to stop downloading the song pages as soon as their lyrics are
+            complete, at the cost of not reusing those connections.
+        result_mode: genius.results.ResultMode
+            Default result mode of the methods that return several songs: models
+            (model), the dictionaries of the api (raw) or named tuples (tuple).
+        search_index: genius.index.SearchIndex
+            Local index where the songs of the responses of the api and their
+            lyrics are added, to search them offline with source="local".
+        """
+        self.prefetch: int = prefetch
+        self.deadline: float | None = deadline
+        self.stream_lyrics: bool = stream_lyrics
+        self.result_mode: ResultMode = ResultMode(result_mode)
+        self.identity: IdentityMap = IdentityMap(self)
         self.api = API(
             access_token,
             cache_path=cache_path,
+            session=session,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            cache_backend=cache_backend,
+            cache_ttl=cache_ttl,
+            rate_limit=rate_limit,
+            retry=retry,
+            timeout=timeout,
+            index=search_index,
         )
+        self.resolver: ArtistResolver = ArtistResolver(self)
+
+    def __enter__(self) -> "Genius":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connections opened by the client.
+        """
+        self.api.close()
+
+    def _prefetch(self, prefetch: int | None) -> int:
+        return self.prefetch if prefetch is None else prefetch
+
+    def _deadline(self, deadline: float | None) -> float | None:
+        return self.deadline if deadline is None else deadline
+
+    def _cached(self, service: str, field: str) -> Optional[Dict]:
+        if cached := self.api.cached(service):
+            return cached.get(field)
+
+        return None
+
+    def _lyrics(
+        self, url: str, parse: Callable[[str], List[str]] = _parse_lyrics
+    ) -> List[str]:
+        lyrics = get_lyrics(
+            url,
+            session=self.api.session,
+            retry=self.api.retry,
+            timeout=self.api.timeout,
+            cache=self.api.cache,
+            stream=self.stream_lyrics,
+            parse=parse,
+        )
+
+        if self.api.index is not None and lyrics:
+            self.api.index.add_lyrics(url, lyrics)
+
+        return lyrics
+
+    def _results(
+        self,
+        songs: Iterable[Dict],
+        mode: ResultMode | None,
+        fields: Sequence[str] | None,
+    ) -> Iterator[Song | Dict | tuple]:
+        mode = ResultMode(mode or self.result_mode)
+
+        if mode == ResultMode.MODEL:
+            return map(self._song, songs)
+
+        return project(songs, mode, fields)
+
+    def _song(self, data: Dict, full: bool = False) -> Song:
+        return self.identity.get(Song, data, full)
+
+    def _artist(self, data: Dict, full: bool = False) -> Artist:
+        return self.identity.get(Artist, data, full)
+
+    def _album(self, data: Dict) -> Album:
+        return self.identity.get(Album, data)
 
     def get_song(self, song_id: int) -> Song:
         """
@@ -180,7 +400,7 @@ class Genius:
         -------
         genius.classes.song.Song
         """
-        return Song(self, self.api.get_song(song_id))
+        return self._song(self.api.get_song(song_id), full=True)
 
     def get_artist(self, artist_id: int) -> Artist:
         """
@@ -195,7 +415,182 @@ class Genius:
         -------
         genius.classes.artist.Artist
         """
-        return Artist(self, self.api.get_artist(artist_id))
+        return self._artist(self.api.get_artist(artist_id), full=True)
+
+    def get_songs(
+        self,
+        song_ids: Iterable[int],
+        workers: int = 8,
+        ordered: bool = True,
+        on_error: ErrorHandler | None = None,
+    ) -> Iterator[Song]:
+        """
+        Retrieve the information of several songs concurrently.
+
+        Parameters
+        ----------
+        song_ids: Iterable[int]
+            IDs of the songs.
+        workers: int
+            Maximum amount of simultaneous requests.
+        ordered: bool
+            Flag to indicate if the songs should be yielded in the order of the
+            IDs, otherwise they are yielded as soon as they are retrieved.
+        on_error: Callable[[int, Exception], None]
+            Function called with the ID and the exception of every song that
+            couldn't be retrieved, failures are logged and skipped if not provided.
+
+        Yields
+        -------
+        genius.classes.song.Song
+        """
+        songs = fetch_many(
+            self.api.get_song,
+            song_ids,
+            workers=workers,
+            ordered=ordered,
+            on_error=on_error,
+            cached=lambda song_id: self._cached(f"songs/{song_id}", "song"),
+        )
+
+        for _, song in songs:
+            yield self._song(song, full=True)
+
+    def get_artists(
+        self,
+        artist_ids: Iterable[int],
+        workers: int = 8,
+        ordered: bool = True,
+        on_error: ErrorHandler | None = None,
+    ) -> Iterator[Artist]:
+        """
+        Retrieve the information of several artists concurrently.
+
+        Parameters
+        ----------
+        artist_ids: Iterable[int]
+            IDs of the artists.
+        workers: int
+            Maximum amount of simultaneous requests.
+        ordered: bool
+            Flag to indicate if the artists should be yielded in the order of the
+            IDs, otherwise they are yielded as soon as they are retrieved.
+        on_error: Callable[[int, Exception], None]
+            Function called with the ID and the exception of every artist that
+            couldn't be retrieved, failures are logged and skipped if not provided.
+
+        Yields
+        -------
+        genius.classes.artist.Artist
+        """
+        artists = fetch_many(
+            self.api.get_artist,
+            artist_ids,
+            workers=workers,
+            ordered=ordered,
+            on_error=on_error,
+            cached=lambda artist_id: self._cached(f"artists/{artist_id}", "artist"),
+        )
+
+        for _, artist in artists:
+            yield self._artist(artist, full=True)
+
+    def lyrics_corpus(
+        self,
+        songs: Iterable[Song],
+        workers: int = 8,
+        processes: int | None = 0,
+    ) -> Iterator[Tuple[Song, List[str]]]:
+        """
+        Retrieve the lyrics of several songs concurrently.
+
+        The pages are downloaded by a pool of threads while the songs are still
+        being consumed (e.g. paginated), and parsed by those threads or by a
+        pool of processes. Only a bounded amount of songs is in flight at any
+        time.
+
+        Parameters
+        ----------
+        songs: Iterable[genius.classes.song.Song]
+            Songs to retrieve the lyrics of.
+        workers: int
+            Maximum amount of simultaneous downloads.
+        processes: int
+            Amount of processes parsing the pages, as many as cpus if None, or 0
+            to parse them in the threads that download them (default).
+
+        Yields
+        -------
+        Tuple[genius.classes.song.Song, List[str]]
+            Song and the lines of its lyrics, as soon as they are retrieved.
+        """
+        pool = ProcessPoolExecutor(max_workers=processes) if processes != 0 else None
+
+        def parse(content: str) -> List[str]:
+            return pool.submit(_parse_lyrics, content).result()
+
+        def lyrics(song: Song) -> List[str]:
+            return self._lyrics(song.url, parse=parse if pool else _parse_lyrics)
+
+        try:
+            # The downloads are stopped before shutting down the pool they use.
+            yield from fetch_many(
+                lyrics, songs, workers=workers, ordered=False, join=pool is not None
+            )
+        finally:
+            if pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def crawl_relationships(
+        self,
+        song_ids: Iterable[int],
+        types: Collection[str] = RELATIONSHIPS,
+        max_depth: int = 2,
+        max_nodes: int = 1000,
+        workers: int = 8,
+        store: EdgeStore | None = None,
+        on_error: ErrorHandler | None = None,
+    ) -> Iterator[Edge]:
+        """
+        Crawl the relationships between songs (samples, covers, remixes...)
+        breadth-first, starting from some songs.
+
+        Parameters
+        ----------
+        song_ids: Iterable[int]
+            IDs of the songs to start from.
+        types: Collection[str]
+            Types of the relationships to follow, all of them by default (see
+            genius.graph.RELATIONSHIPS).
+        max_depth: int
+            Maximum amount of relationships between the first songs and any
+            other song.
+        max_nodes: int
+            Maximum amount of songs in the graph.
+        workers: int
+            Maximum amount of simultaneous requests.
+        store: genius.graph.EdgeStore
+            Store where the edges are written as they are found.
+        on_error: Callable[[int, Exception], None]
+            Function called with the ID and the exception of every song that
+            couldn't be retrieved, failures are logged and skipped if not provided.
+
+        Yields
+        -------
+        genius.graph.Edge
+            Relationship between two songs, as soon as it's found.
+        """
+        yield from crawl(
+            self.api.get_song,
+            song_ids,
+            types=types,
+            max_depth=max_depth,
+            max_nodes=max_nodes,
+            workers=workers,
+            store=store,
+            on_error=on_error,
+            cached=lambda song_id: self._cached(f"songs/{song_id}", "song"),
+        )
 
     def get_artist_songs(
         self,
@@ -203,7 +598,9 @@ class Genius:
         page: int = 1,
         per_page: int = 50,
         sort: str = SortingKeys.TITLE,
-    ) -> Iterator[Song]:
+        mode: ResultMode | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> Iterator[Song | Dict | tuple]:
         """
         Retrieve the songs of an artist.
 
@@ -217,6 +614,11 @@ class Genius:
             Amount of songs per page.
         sort: string
             Sort key for the songs (title/popularity).
+        mode: genius.results.ResultMode
+            Result mode (model/raw/tuple), defaults to the one of the client.
+        fields: Sequence[str]
+            Fields to keep in the raw and tuple modes, nested ones separated by
+            dots (e.g. "primary_artist.name").
 
         Returns
         -------
@@ -224,9 +626,10 @@ class Genius:
             Songs of the artist.
         """
 
-        return map(
-            lambda song: Song(self, song),
+        return self._results(
             self.api.get_artist_songs(artist_id, page, per_page, sort),
+            mode,
+            fields,
         )
 
     def get_album_songs(
@@ -234,7 +637,9 @@ class Genius:
         album_id: int,
         page: int = 1,
         per_page: int = 50,
-    ) -> Iterator[Song]:
+        mode: ResultMode | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> Iterator[Song | Dict | tuple]:
         """
         Retrieve the songs of an album.
 
@@ -246,6 +651,11 @@ class Genius:
             Desired page.
         per_page: int
             Amount of songs per page.
+        mode: genius.results.ResultMode
+            Result mode (model/raw/tuple), defaults to the one of the client.
+        fields: Sequence[str]
+            Fields to keep in the raw and tuple modes, nested ones separated by
+            dots (e.g. "primary_artist.name").
 
         Returns
         -------
@@ -253,14 +663,20 @@ class Genius:
             Songs of the artist.
         """
 
-        return map(
-            lambda track: Song(self, track["song"]),
-            self.api.get_album_songs(album_id, page, per_page),
-        )
+        tracks = self.api.get_album_songs(album_id, page, per_page)
+
+        return self._results((track["song"] for track in tracks), mode, fields)
 
     def get_all_artist_songs(
-        self, artist_id: int, sort: str = "title"
-    ) -> Iterator[Song]:
+        self,
+        artist_id: int,
+        sort: str = "title",
+        prefetch: int | None = None,
+        deadline: float | None = None,
+        partial: bool = False,
+        mode: ResultMode | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> Iterator[Song | Dict | tuple]:
         """
         Retrieve the all the songs of an artist.
 
@@ -270,24 +686,40 @@ class Genius:
             ID of the artist.
         sort: string
             Sort key for the songs (title/popularity).
+        prefetch: int
+            Amount of pages to fetch ahead (defaults to the one of the client).
+        deadline: float
+            Seconds to iterate for (defaults to the one of the client).
+        partial: bool
+            Flag to stop silently when the deadline expires, instead of raising
+            genius.exceptions.DeadlineExceeded after the songs retrieved so far.
+        mode: genius.results.ResultMode
+            Result mode (model/raw/tuple), defaults to the one of the client.
+        fields: Sequence[str]
+            Fields to keep in the raw and tuple modes, nested ones separated by
+            dots (e.g. "primary_artist.name").
 
         Yields
         -------
         genius.classes.song.Song
             Song of the artist.
         """
-        page = 0
-
-        while True:
-            page += 1
-            songs = list(self.get_artist_songs(artist_id, page=page, sort=sort))
-
-            if not songs:
-                break
+        songs = paginate(
+            lambda page: self.api.get_artist_songs(artist_id, page=page, sort=sort),
+            prefetch=self._prefetch(prefetch),
+            deadline=self._deadline(deadline),
+            partial=partial,
+        )
 
-            yield from songs
+        yield from self._results(songs, mode, fields)
 
-    def get_all_album_songs(self, album_id: int) -> Iterator[Song]:
+    def get_all_album_songs(
+        self,
+        album_id: int,
+        prefetch: int | None = None,
+        mode: ResultMode | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> Iterator[Song | Dict | tuple]:
         """
         Retrieve the all the songs of an artist.
 
@@ -295,24 +727,35 @@ class Genius:
         ----------
         album_id: int
             ID of the album.
+        prefetch: int
+            Amount of pages to fetch ahead (defaults to the one of the client).
+        mode: genius.results.ResultMode
+            Result mode (model/raw/tuple), defaults to the one of the client.
+        fields: Sequence[str]
+            Fields to keep in the raw and tuple modes, nested ones separated by
+            dots (e.g. "primary_artist.name").
 
         Yields
         -------
         genius.classes.song.Song
             Song of the artist.
         """
-        page = 0
-
-        while True:
-            page += 1
-            songs = list(self.get_album_songs(album_id, page=page))
-
-            if not songs:
-                break
+        tracks = paginate(
+            lambda page: self.api.get_album_songs(album_id, page=page),
+            prefetch=self._prefetch(prefetch),
+        )
 
-            yield from songs
+        yield from self._results((track["song"] for track in tracks), mode, fields)
 
-    def search(self, text: str, page: int = 1, per_page: int = 20) -> Iterator[Song]:
+    def search(
+        self,
+        text: str,
+        page: int = 1,
+        per_page: int = 20,
+        mode: ResultMode | None = None,
+        fields: Sequence[str] | None = None,
+        source: SearchSource = SearchSource.API,
+    ) -> Iterator[Song | Dict | tuple]:
         """
         Search for songs that match with the provided text.
 
@@ -324,17 +767,41 @@ class Genius:
             Desired page.
         per_page: int
             Amount of songs per page.
+        mode: genius.results.ResultMode
+            Result mode (model/raw/tuple), defaults to the one of the client.
+        fields: Sequence[str]
+            Fields to keep in the raw and tuple modes, nested ones separated by
+            dots (e.g. "primary_artist.name").
+        source: genius.index.SearchSource
+            Where to search, the api (api) or the local index of the client
+            (local), which matches the titles, artists and lyrics of the songs
+            retrieved so far.
 
         Returns
         -------
         Iterator[genius.classes.song.Song]
             Songs that match the search text.
         """
+        if SearchSource(source) == SearchSource.LOCAL:
+            if self.api.index is None:
+                raise ValueError("a search_index is required to search locally")
+
+            result = self.api.index.search(text, page=page, per_page=per_page)
+        else:
+            result = self.api.search(text=text, page=page, per_page=per_page)
 
-        result = self.api.search(text=text, page=page, per_page=per_page)
-        return map(lambda song: Song(self, song), result)
+        return self._results(result, mode, fields)
 
-    def search_all(self, text: str, page_limit: int = 10) -> Iterator[Song]:
+    def search_all(
+        self,
+        text: str,
+        page_limit: int = 10,
+        prefetch: int | None = None,
+        deadline: float | None = None,
+        partial: bool = False,
+        mode: ResultMode | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> Iterator[Song | Dict | tuple]:
         """
         Search for all the songs that match with the provided text.
 
@@ -344,29 +811,37 @@ class Genius:
             Text to search.
         page_limit: int
             Limit of pages in the search.
+        prefetch: int
+            Amount of pages to fetch ahead (defaults to the one of the client).
+        deadline: float
+            Seconds to iterate for (defaults to the one of the client).
+        partial: bool
+            Flag to stop silently when the deadline expires, instead of raising
+            genius.exceptions.DeadlineExceeded after the songs retrieved so far.
+        mode: genius.results.ResultMode
+            Result mode (model/raw/tuple), defaults to the one of the client.
+        fields: Sequence[str]
+            Fields to keep in the raw and tuple modes, nested ones separated by
+            dots (e.g. "primary_artist.name").
 
         Yields
         -------
         genius.classes.song.Song
             Song that matches the search text.
         """
+        songs = paginate(
+            lambda page: list(self.api.search(text, page=page)),
+            prefetch=self._prefetch(prefetch),
+            page_limit=page_limit,
+            deadline=self._deadline(deadline),
+            partial=partial,
+        )
 
-        page = 0
-
-        while True:
-            page += 1
-
-            if page_limit and page > page_limit:
-                break
-
-            songs = list(self.search(text, page=page))
-
-            if not songs:
-                break
-
-            yield from songs
+        yield from self._results(songs, mode, fields)
 
-    def search_artist(self, name: str) -> Optional[Artist]:
+    def search_artist(
+        self, name: str, deadline: float | None = None, partial: bool = False
+    ) -> Optional[Artist]:
         """
         Search for an artist that match with the provided text.
 
@@ -374,6 +849,11 @@ class Genius:
         ----------
         name: str
             Name of the artist to search.
+        deadline: float
+            Seconds to search for (defaults to the one of the client).
+        partial: bool
+            Flag to return None when the deadline expires, instead of raising
+            genius.exceptions.DeadlineExceeded.
 
         Returns
         -------
@@ -382,10 +862,59 @@ class Genius:
         """
         name = name.lower()
 
-        for song in self.search_all(name):
+        songs = self.search_all(
+            name, deadline=deadline, partial=partial, mode=ResultMode.MODEL
+        )
+
+        for song in songs:
             artist = song.artist
 
             if name == artist.name.lower():
                 return artist
 
         return None
+
+    def resolve_artist(self, name: str) -> Optional[int]:
+        """
+        Resolve the name of an artist to its ID, comparing the names normalized
+        (e.g. "beyonce" matches "Beyoncé") and also the alternate names. It's
+        much cheaper than search_artist, as it stops at the first match, and
+        the resolved names are remembered (in the cache too, if there's one).
+
+        Parameters
+        ----------
+        name: str
+            Name of the artist.
+
+        Returns
+        -------
+        int
+            ID of the artist, None if no artist matches the name.
+        """
+        return self.resolver.resolve(name)
+
+    def resolve_artists(
+        self,
+        names: Iterable[str],
+        workers: int = 8,
+        on_error: ErrorHandler | None = None,
+    ) -> Dict[str, Optional[int]]:
+        """
+        Resolve the names of several artists to their IDs concurrently.
+
+        Parameters
+        ----------
+        names: Iterable[str]
+            Names of the artists.
+        workers: int
+            Maximum amount of simultaneous searches.
+        on_error: Callable[[str, Exception], None]
+            Function called with the name and the exception of every name that
+            couldn't be resolved, failures are logged and skipped if not provided.
+
+        Returns
+        -------
+        Dict[str, int]
+            ID of the artist of each name, None for the names without a match.
+        """
+        return self.resolver.resolve_many(names, workers=workers, on_error=on_error)
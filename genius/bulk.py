@@ -0,0 +1,120 @@
+import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+ErrorHandler = Callable[[K, Exception], None]
+
+logger = logging.getLogger(__name__)
+
+_EXHAUSTED = object()
+
+
+def fetch_many(
+    fetch: Callable[[K], T],
+    keys: Iterable[K],
+    workers: int = 8,
+    ordered: bool = True,
+    on_error: Optional[ErrorHandler] = None,
+    cached: Optional[Callable[[K], Optional[T]]] = None,
+    join: bool = False,
+) -> Iterator[Tuple[K, T]]:
+    """
+    Fetch several resources using a bounded pool of threads.
+
+    Parameters
+    ----------
+    fetch: Callable
+        Function that retrieves the resource of a key.
+    keys: Iterable
+        Keys of the resources, consumed as the resources are being fetched.
+    workers: int
+        Maximum amount of simultaneous fetches.
+    ordered: bool
+        Flag to indicate if the resources should be yielded in the order of the
+        keys, otherwise they are yielded as soon as they are fetched.
+    on_error: Callable[[key, Exception], None]
+        Function called with the key and the exception of every failed fetch,
+        failures are logged and skipped if not provided.
+    cached: Callable
+        Function that returns the resource of a key if it's already available,
+        to avoid scheduling a fetch for it.
+    join: bool
+        Flag to wait for the fetches still running when the iteration is
+        stopped early, e.g. when they use resources released afterwards.
+
+    Yields
+    -------
+    Tuple[key, resource]
+    """
+    assert workers > 0
+
+    executor = ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="genius-bulk",
+    )
+    pending: Deque[Future] = deque()
+    keys_of: Dict[Future, K] = {}
+    keys = iter(keys)
+
+    def submit() -> bool:
+        key = next(keys, _EXHAUSTED)
+
+        if key is _EXHAUSTED:
+            return False
+
+        data = cached(key) if cached else None
+
+        if data is None:
+            future = executor.submit(fetch, key)
+        else:
+            future = Future()
+            future.set_result(data)
+
+        keys_of[future] = key
+        pending.append(future)
+        return True
+
+    def completed() -> Iterator[Future]:
+        if ordered:
+            yield pending.popleft()
+            return
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            pending.remove(future)
+            yield future
+
+    try:
+        # Keep a bounded window of scheduled keys, so the input can be huge.
+        while len(pending) < workers * 2 and submit():
+            pass
+
+        while pending:
+            for future in list(completed()):
+                key = keys_of.pop(future)
+
+                try:
+                    data = future.result()
+                except Exception as exc:
+                    _report(on_error, key, exc)
+                else:
+                    yield key, data
+
+                submit()
+    finally:
+        for future in pending:
+            future.cancel()
+
+        executor.shutdown(wait=join, cancel_futures=True)
+
+
+def _report(on_error: Optional[ErrorHandler], key, exc: Exception) -> None:
+    if on_error:
+        on_error(key, exc)
+    else:
+        logger.error("Failed to fetch %s: %s", key, exc)
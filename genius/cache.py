@@ -0,0 +1,835 @@
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
+from urllib.parse import urlencode
+
+from genius.codecs import Codec
+
+LRU = "lru"
+LFU = "lfu"
+
+
+class CacheBackend(Protocol):
+    """
+    Storage of the cached responses of the api, indexed by canonical keys.
+    """
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]: ...
+
+    def set(self, key: str, value: Dict[str, Any]) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class LockingCacheBackend(CacheBackend, Protocol):
+    """
+    Backend that can coordinate several processes writing the same entry.
+    """
+
+    def locked(self, key: str, timeout: float) -> ContextManager[bool]: ...
+
+
+@contextmanager
+def _polling(
+    acquire: Callable[[], bool],
+    release: Callable[[], None],
+    timeout: float,
+) -> Iterator[bool]:
+    """
+    Wait up to timeout seconds for a lock, yielding whether it was acquired.
+    """
+    deadline = time.monotonic() + timeout
+
+    while not (acquired := acquire()) and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            release()
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    # Readers only ever see the previous or the new content, never a partial one.
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+
+        os.replace(temporary, path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+class _Usage:
+    """
+    Size and usage of the entries of a bounded backend, to pick which ones to
+    evict once the limits are exceeded.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        policy: str = LRU,
+    ) -> None:
+        assert policy in (LRU, LFU)
+
+        self.max_entries: Optional[int] = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.policy: str = policy
+
+        # Ordered from the least to the most recently used: {key: [size, uses]}.
+        self.entries: OrderedDict[str, List[int]] = OrderedDict()
+        self.bytes: int = 0
+        self.evictions: int = 0
+
+    @property
+    def bounded(self) -> bool:
+        return bool(self.max_entries or self.max_bytes)
+
+    def touch(self, key: str) -> None:
+        if entry := self.entries.get(key):
+            entry[1] += 1
+            self.entries.move_to_end(key)
+
+    def add(self, key: str, size: int) -> List[str]:
+        """
+        Register an entry and return the keys of the entries to evict.
+        """
+        self.remove(key)
+        self.entries[key] = [size, 1]
+        self.bytes += size
+
+        victims = []
+
+        while len(self.entries) > 1 and self.exceeded:
+            victim = self.victim(protected=key)
+            self.remove(victim)
+            self.evictions += 1
+            victims.append(victim)
+
+        return victims
+
+    def remove(self, key: str) -> None:
+        if entry := self.entries.pop(key, None):
+            self.bytes -= entry[0]
+
+    @property
+    def exceeded(self) -> bool:
+        if self.max_entries and len(self.entries) > self.max_entries:
+            return True
+
+        return bool(self.max_bytes and self.bytes > self.max_bytes)
+
+    def victim(self, protected: str) -> str:
+        candidates = (key for key in self.entries if key != protected)
+
+        if self.policy == LRU:
+            return next(candidates)
+
+        return min(candidates, key=lambda key: self.entries[key][1])
+
+
+def _dumps(value: Dict[str, Any]) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+class MemoryCache:
+    """
+    Cache backend that keeps the responses in a dictionary.
+
+    Responses are kept serialized, so every read returns a new copy that can be
+    modified without affecting the cached one.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        policy: str = LRU,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_entries: int
+            Maximum amount of responses to keep.
+        max_bytes: int
+            Maximum size of the responses to keep (measured as compact json).
+        policy: str
+            Eviction policy once a limit is reached (lru/lfu).
+        ttl: float
+            Seconds to keep each response in memory, on top of its own expiration.
+        """
+        self.entries: Dict[str, bytes] = {}
+        self.stored: Dict[str, float] = {}
+        self.codec = Codec(compression=None)
+        self.usage = _Usage(max_entries, max_bytes, policy)
+        self.ttl: Optional[float] = ttl
+        self.lock = threading.Lock()
+
+    @property
+    def evictions(self) -> int:
+        return self.usage.evictions
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            if self.ttl and self.stored.get(key, 0) + self.ttl < time.monotonic():
+                self._remove(key)
+                return None
+
+            self.usage.touch(key)
+            data = self.entries.get(key)
+
+        return Codec.decode(data) if data is not None else None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        data = self.codec.encode(value)
+        size = len(data) if self.usage.max_bytes else 0
+
+        with self.lock:
+            self.entries[key] = data
+
+            if self.ttl:
+                self.stored[key] = time.monotonic()
+
+            if not self.usage.bounded:
+                return
+
+            for victim in self.usage.add(key, size):
+                self._remove(victim)
+
+    def delete(self, key: str) -> None:
+        with self.lock:
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        self.usage.remove(key)
+        self.entries.pop(key, None)
+        self.stored.pop(key, None)
+
+
+class FileCache:
+    """
+    Cache backend that stores every response in a json file inside a directory.
+
+    The files are grouped in one directory per service, named after a digest of
+    the canonical key. When bounded, the modification time of the files is used
+    to keep track of their last use between runs.
+
+    Files are replaced atomically, so several processes can share the directory,
+    and lock files let only one of them fetch a missing entry at a time.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        policy: str = LRU,
+        codec: Optional[Codec] = None,
+        stale: float = 60,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        path: str
+            Directory where the responses will be stored.
+        max_entries: int
+            Maximum amount of files to keep.
+        max_bytes: int
+            Maximum size of the files to keep.
+        policy: str
+            Eviction policy once a limit is reached (lru/lfu).
+        codec: genius.codecs.Codec
+            Compact format to store the responses, they are stored as indented
+            json if not set. Files of both formats can be read.
+        stale: float
+            Seconds after which the lock of an entry is considered abandoned.
+        """
+        self.path: Path = Path(path)
+        self.codec: Optional[Codec] = codec
+        self.usage = _Usage(max_entries, max_bytes, policy)
+        self.lock = threading.Lock()
+        self.scanned: bool = False
+        self.stale: float = stale
+
+    @property
+    def evictions(self) -> int:
+        return self.usage.evictions
+
+    def file(self, key: str) -> Path:
+        service, _, _ = key.partition("?")
+        digest = hashlib.sha1(key.encode()).hexdigest()
+
+        return self.path / service / f"{digest}.json"
+
+    def scan(self) -> None:
+        # Index the files stored by previous runs, from the least recently used.
+        files = [(path.stat(), path) for path in self.path.rglob("*.json")]
+
+        for stat, path in sorted(files, key=lambda file: file[0].st_mtime):
+            self.usage.add(str(path), stat.st_size)
+
+        self.scanned = True
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self.file(key)
+
+        try:
+            value = Codec.decode(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # Corrupted (e.g. truncated by a crash), removed and fetched again.
+            self.delete(key)
+            return None
+
+        if self.usage.bounded:
+            with self.lock:
+                if not self.scanned:
+                    self.scan()
+
+                self.usage.touch(str(path))
+
+            try:
+                os.utime(path)
+            except FileNotFoundError:
+                # Evicted by another thread or process since it was read.
+                pass
+
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        path = self.file(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.codec:
+            data = self.codec.encode(value)
+        else:
+            data = json.dumps(value, indent=2).encode()
+
+        _write_atomically(path, data)
+
+        if not self.usage.bounded:
+            return
+
+        with self.lock:
+            if not self.scanned:
+                self.scan()
+
+            victims = self.usage.add(str(path), path.stat().st_size)
+
+        for victim in victims:
+            Path(victim).unlink(missing_ok=True)
+
+    def delete(self, key: str) -> None:
+        path = self.file(key)
+
+        with self.lock:
+            self.usage.remove(str(path))
+
+        path.unlink(missing_ok=True)
+
+    def locked(self, key: str, timeout: float) -> ContextManager[bool]:
+        path = self.file(key).with_suffix(".lock")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        def acquire() -> bool:
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return True
+            except FileExistsError:
+                pass
+
+            try:
+                if time.time() - path.stat().st_mtime > self.stale:
+                    path.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+
+            return False
+
+        return _polling(acquire, lambda: path.unlink(missing_ok=True), timeout)
+
+
+class SQLiteCache:
+    """
+    Cache backend that stores all the responses in a single sqlite database.
+
+    The database can be shared by several processes, which use a table of
+    locks to let only one of them fetch a missing entry at a time.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        policy: str = LRU,
+        codec: Optional[Codec] = None,
+        stale: float = 60,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        path: str
+            Path of the database file.
+        max_entries: int
+            Maximum amount of responses to keep.
+        max_bytes: int
+            Maximum size of the responses to keep.
+        policy: str
+            Eviction policy once a limit is reached (lru/lfu).
+        codec: genius.codecs.Codec
+            Compact format to store the responses, they are stored as minified
+            json if not set. Entries of both formats can be read.
+        stale: float
+            Seconds after which the lock of an entry is considered abandoned.
+        """
+        self.path: Path = Path(path)
+        self.codec: Optional[Codec] = codec
+        self.stale: float = stale
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.usage = _Usage(max_entries, max_bytes, policy)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value TEXT, size INTEGER, stored REAL)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, expires REAL)"
+            )
+
+            if self.usage.bounded:
+                rows = self.connection.execute(
+                    "SELECT key, size FROM cache ORDER BY stored"
+                )
+
+                for key, size in rows:
+                    self.usage.add(key, size)
+
+    @property
+    def evictions(self) -> int:
+        return self.usage.evictions
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            self.usage.touch(key)
+
+        if not row:
+            return None
+
+        try:
+            return Codec.decode(row[0])
+        except ValueError:
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        value = self.codec.encode(value) if self.codec else _dumps(value)
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, size, stored) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()),
+            )
+
+            victims = self.usage.add(key, len(value)) if self.usage.bounded else []
+
+            self.connection.executemany(
+                "DELETE FROM cache WHERE key = ?", [(victim,) for victim in victims]
+            )
+
+    def delete(self, key: str) -> None:
+        with self.lock, self.connection:
+            self.usage.remove(key)
+            self.connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def locked(self, key: str, timeout: float) -> ContextManager[bool]:
+        def acquire() -> bool:
+            now = time.time()
+
+            with self.lock, self.connection:
+                self.connection.execute(
+                    "DELETE FROM locks WHERE key = ? AND expires < ?", (key, now)
+                )
+                cursor = self.connection.execute(
+                    "INSERT OR IGNORE INTO locks (key, expires) VALUES (?, ?)",
+                    (key, now + self.stale),
+                )
+
+            return cursor.rowcount == 1
+
+        def release() -> None:
+            with self.lock, self.connection:
+                self.connection.execute("DELETE FROM locks WHERE key = ?", (key,))
+
+        return _polling(acquire, release, timeout)
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+class RedisCache:
+    """
+    Cache backend for servers that speak the redis protocol.
+
+    Any client with the get/set/delete methods of redis-py can be provided,
+    otherwise one is created from the url (requires the redis extra). Size
+    limits are left to the eviction policy of the server (maxmemory-policy).
+
+    Missing entries are locked with SET NX, so only one of the processes that
+    share the server fetches them at a time.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "genius:",
+        codec: Optional[Codec] = None,
+        stale: float = 60,
+    ) -> None:
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(url)
+
+        self.client = client
+        self.prefix: str = prefix
+        self.codec: Optional[Codec] = codec
+        self.stale: float = stale
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = self.client.get(self.prefix + key)
+
+        if value is None:
+            return None
+
+        try:
+            return Codec.decode(value)
+        except ValueError:
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        value = self.codec.encode(value) if self.codec else _dumps(value)
+        self.client.set(self.prefix + key, value)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+    def locked(self, key: str, timeout: float) -> ContextManager[bool]:
+        name = f"{self.prefix}lock:{key}"
+
+        return _polling(
+            lambda: bool(self.client.set(name, 1, nx=True, px=int(self.stale * 1000))),
+            lambda: self.client.delete(name),
+            timeout,
+        )
+
+
+def migrate(path: str | Path, codec: Optional[Codec] = None) -> int:
+    """
+    Rewrite in place the responses stored by a genius.cache.FileCache with a codec.
+
+    Parameters
+    ----------
+    path: str
+        Directory of the cache.
+    codec: genius.codecs.Codec
+        Format to rewrite the responses with (zlib compressed json by default).
+
+    Returns
+    -------
+    int
+        Amount of rewritten files.
+    """
+    codec = codec or Codec()
+    rewritten = 0
+
+    for file in Path(path).rglob("*.json"):
+        data = file.read_bytes()
+
+        if data.startswith(codec.header):
+            continue
+
+        _write_atomically(file, codec.encode(Codec.decode(data)))
+
+        rewritten += 1
+
+    return rewritten
+
+
+class TieredCache:
+    """
+    Cache backend that keeps the most used responses of another backend in
+    memory, to avoid reading them again from the storage.
+
+    Responses are read from the memory first, and both reads from the storage
+    and writes populate the memory.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        memory: Optional[MemoryCache] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        backend: genius.cache.CacheBackend
+            Backend where the responses are stored.
+        memory: genius.cache.MemoryCache
+            Backend that keeps the responses in memory, bounded to 1024 entries
+            by default.
+        """
+        self.backend: CacheBackend = backend
+        self.memory: MemoryCache = memory or MemoryCache(max_entries=1024)
+        self.memory_hits: int = 0
+        self.lock = threading.Lock()
+
+    @property
+    def evictions(self) -> int:
+        return getattr(self.backend, "evictions", 0)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if (value := self.memory.get(key)) is not None:
+            with self.lock:
+                self.memory_hits += 1
+            return value
+
+        if (value := self.backend.get(key)) is not None:
+            self.memory.set(key, value)
+
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        self.backend.set(key, value)
+        self.memory.set(key, value)
+
+    def delete(self, key: str) -> None:
+        self.memory.delete(key)
+        self.backend.delete(key)
+
+    def locked(self, key: str, timeout: float) -> ContextManager[bool]:
+        if locked := getattr(self.backend, "locked", None):
+            return locked(key, timeout)
+
+        return nullcontext(False)
+
+
+class Cache:
+    """
+    Cache of the responses of the api.
+
+    Responses are stored in a backend, indexed by a canonical key built from
+    the service and all the params of the request. Each entry keeps its own
+    expiration time next to the response, so a lookup is a single read.
+
+    A cache can be shared by all the threads of a client, as its counters are
+    updated under a lock and every backend is safe to use from several threads.
+    """
+
+    def __init__(
+        self,
+        cache_path: str | None = None,
+        backend: CacheBackend | None = None,
+        ttl: float | Dict[str, float] | None = None,
+        lock_timeout: float = 30,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        cache_path: str
+            Directory where the responses will be stored as json files, with the
+            most used ones also kept in memory.
+        backend: genius.cache.CacheBackend
+            Backend where the responses will be stored (overrides cache_path).
+        ttl: float | Dict[str, float]
+            Seconds the responses are valid for. Can be set per service with
+            patterns, e.g. {"search": 3600, "songs/*": 604800}, where the first
+            matching pattern wins. Responses never expire if not set.
+        lock_timeout: float
+            Seconds to wait for another process that is fetching the same
+            response, before fetching it anyway.
+        """
+        if backend is None and cache_path:
+            backend = TieredCache(FileCache(cache_path))
+
+        self.backend: CacheBackend | None = backend
+        self.ttl: float | Dict[str, float] | None = ttl
+        self.lock_timeout: float = lock_timeout
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.expirations: int = 0
+        self.lock = threading.Lock()
+
+    def count(self, hits: int = 0, misses: int = 0, expirations: int = 0) -> None:
+        with self.lock:
+            self.hits += hits
+            self.misses += misses
+            self.expirations += expirations
+
+    @staticmethod
+    def key(service: str, **params) -> str:
+        params = sorted(
+            (name, str(value)) for name, value in params.items() if value is not None
+        )
+
+        if not params:
+            return service
+
+        return f"{service}?{urlencode(params)}"
+
+    def ttl_of(self, service: str) -> Optional[float]:
+        if not isinstance(self.ttl, dict):
+            return self.ttl
+
+        for pattern, ttl in self.ttl.items():
+            if fnmatch(service, pattern):
+                return ttl
+
+        return None
+
+    def load(self, service: str, **params) -> Optional[Dict[str, Any]]:
+        if not self.backend:
+            return None
+
+        key = self.key(service, **params)
+        entry = self.backend.get(key)
+
+        if entry is None:
+            self.count(misses=1)
+            return None
+
+        expires = entry.get("expires")
+
+        if expires and expires < time.time():
+            self.backend.delete(key)
+            self.count(misses=1, expirations=1)
+            return None
+
+        self.count(hits=1)
+        return entry["response"]
+
+    def lookup(self, service: str, **params) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Load a response even if it expired, so it can be revalidated.
+
+        Returns
+        -------
+        Tuple[Dict[str, Any], bool]
+            The response (None if missing) and whether it expired.
+        """
+        if not self.backend:
+            return None, False
+
+        entry = self.backend.get(self.key(service, **params))
+
+        if entry is None:
+            self.count(misses=1)
+            return None, False
+
+        expires = entry.get("expires")
+        expired = bool(expires and expires < time.time())
+
+        if expired:
+            self.count(misses=1)
+        else:
+            self.count(hits=1)
+
+        return entry["response"], expired
+
+    def save(
+        self,
+        service: str,
+        data: Dict[str, Any],
+        ttl: Optional[float] = None,
+        **params,
+    ) -> None:
+        """
+        Store a response, valid for the given seconds or the ttl of its service.
+        """
+        if not self.backend:
+            return
+
+        ttl = ttl or self.ttl_of(service)
+
+        entry = {
+            "expires": time.time() + ttl if ttl else None,
+            "response": data,
+        }
+
+        self.backend.set(self.key(service, **params), entry)
+
+    def locked(self, service: str, **params) -> ContextManager[bool]:
+        """
+        Lock a response while it's being fetched, if the backend supports it.
+
+        Returns
+        -------
+        ContextManager[bool]
+            Yields whether the lock was acquired.
+        """
+        locked = getattr(self.backend, "locked", None)
+
+        if not locked:
+            return nullcontext(False)
+
+        return locked(self.key(service, **params), self.lock_timeout)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters of the usage of the cache.
+
+        Returns
+        -------
+        Dict[str, int]
+            hits, misses, expirations and evictions (for bounded backends).
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "evictions": getattr(self.backend, "evictions", 0),
+            }
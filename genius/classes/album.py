@@ -1,8 +1,10 @@
 import typing
 
+from genius.results import ResultMode
+
 from .commons import Base
 
-from typing import Iterator
+from typing import Iterator, List, Optional, Tuple
 from .artist import Artist
 
 if typing.TYPE_CHECKING:
@@ -25,12 +27,20 @@ class Album(Base):
         url of the album in genius.
     """
 
+    __slots__ = (
+        "id",
+        "artist",
+        "cover_art_url",
+        "name",
+        "url",
+    )
+
     def __init__(self, genius, data):
         super().__init__(genius)
 
         self.id: int = data["id"]
 
-        self.artist: "Artist" = Artist(genius, data["artist"])
+        self.artist: "Artist" = genius._artist(data["artist"])
         self.cover_art_url: str = data.get("cover_art_url")
         self.name: str = data["name"]
         self.url: str = data["url"]
@@ -45,7 +55,31 @@ class Album(Base):
         genius.classes.song.Song
             Song of the artist.
         """
-        yield from self.genius.get_all_album_songs(self.id)
+        yield from self.genius.get_all_album_songs(self.id, mode=ResultMode.MODEL)
+
+    def lyrics_corpus(
+        self, workers: int = 8, processes: Optional[int] = 0
+    ) -> Iterator[Tuple["Song", List[str]]]:
+        """
+        Fetch the lyrics of all the songs of the album concurrently, while
+        paginating them.
+
+        Parameters
+        ----------
+        workers: int
+            Maximum amount of simultaneous downloads.
+        processes: int
+            Amount of processes parsing the pages, as many as cpus if None, or 0
+            to parse them in the threads that download them (default).
+
+        Yields
+        -------
+        Tuple[genius.classes.song.Song, List[str]]
+            Song and the lines of its lyrics, as soon as they are retrieved.
+        """
+        yield from self.genius.lyrics_corpus(
+            self.songs, workers=workers, processes=processes
+        )
 
     def __repr__(self):  # pragma: no cover
         return f"{self.name} ({self.id})"
@@ -1,4 +1,7 @@
-from typing import Dict, Iterator, List, Optional
+from functools import wraps
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from genius.results import ResultMode
 
 from .commons import Base
 from .social_media import SocialMedia
@@ -6,12 +9,11 @@ from .social_media import SocialMedia
 
 def lazy_property(prop):
     @property
+    @wraps(prop)
     def wrapper(*args):
         self = args[0]
         if not self._fully_loaded_:
-            data = self.genius.api.get_artist(self.id)
-            self.__init_extra_data__(data)
-            self._fully_loaded_ = True
+            self.genius.identity.load(self, self.genius.api.get_artist)
         return prop(self)
 
     return wrapper
@@ -45,6 +47,19 @@ class Artist(Base):
         **the attributes marked with a * will trigger one extra call to the api.**
     """
 
+    __slots__ = (
+        "id",
+        "header_image_url",
+        "image_url",
+        "is_verified",
+        "name",
+        "url",
+        "__alternate_names",
+        "__description",
+        "__followers_count",
+        "__social_media",
+    )
+
     def __init__(self, genius, data):
         super().__init__(genius)
 
@@ -89,14 +104,15 @@ class Artist(Base):
     @property
     def songs(self) -> Iterator["Song"]:
         """
-        Fetch all the songs of the artist sorted by **title**.
+        Fetch all the songs of the artist sorted by **title**, within the
+        deadline of the client.
 
         Yields
         -------
         genius.classes.song.Song
             Song of the artist.
         """
-        yield from self.genius.get_all_artist_songs(self.id)
+        yield from self.genius.get_all_artist_songs(self.id, mode=ResultMode.MODEL)
 
     @property
     def songs_by_popularity(self) -> Iterator["Song"]:
@@ -108,7 +124,33 @@ class Artist(Base):
         genius.classes.song.Song
             Song of the artist.
         """
-        yield from self.genius.get_all_artist_songs(self.id, sort="popularity")
+        yield from self.genius.get_all_artist_songs(
+            self.id, sort="popularity", mode=ResultMode.MODEL
+        )
+
+    def lyrics_corpus(
+        self, workers: int = 8, processes: Optional[int] = 0
+    ) -> Iterator[Tuple["Song", List[str]]]:
+        """
+        Fetch the lyrics of all the songs of the artist concurrently, while
+        paginating them.
+
+        Parameters
+        ----------
+        workers: int
+            Maximum amount of simultaneous downloads.
+        processes: int
+            Amount of processes parsing the pages, as many as cpus if None, or 0
+            to parse them in the threads that download them (default).
+
+        Yields
+        -------
+        Tuple[genius.classes.song.Song, List[str]]
+            Song and the lines of its lyrics, as soon as they are retrieved.
+        """
+        yield from self.genius.lyrics_corpus(
+            self.songs, workers=workers, processes=processes
+        )
 
     def __repr__(self):  # pragma: no cover
         return f"{self.name} ({self.id})"
@@ -1,5 +1,106 @@
+import threading
+from typing import Callable, Dict, Tuple, Type, TypeVar
+from weakref import WeakValueDictionary
+
+from genius.singleflight import SingleFlight
+
+T = TypeVar("T", bound="Base")
+
+# Locks shared by all the models, picked by their class and id, so the data of an
+# object is replaced at once without keeping a lock in every instance. They are
+# never held during a request, as unrelated objects share them.
+LOAD_LOCKS: Tuple[threading.Lock, ...] = tuple(threading.Lock() for _ in range(64))
+
+
 class Base:
-    _fully_loaded_: bool = False
+    # Models don't have a __dict__, to keep large catalogs compact in memory.
+    __slots__ = ("genius", "_fully_loaded_", "__weakref__")
 
     def __init__(self, genius):
         self.genius = genius
+        self._fully_loaded_: bool = False
+
+    def _load_lock(self) -> threading.Lock:
+        return LOAD_LOCKS[hash((type(self), self.id)) % len(LOAD_LOCKS)]
+
+    def _refresh(self, data: Dict) -> None:
+        # Rebuilt from the full data of the api, if it was built from a listing.
+        with self._load_lock():
+            if not self._fully_loaded_:
+                type(self).__init__(self, self.genius, data)
+                self._fully_loaded_ = True
+
+
+class IdentityMap:
+    """
+    Objects created by a client, indexed by their class and id, so the same
+    song, artist or album is always represented by one shared object (and
+    loaded once) while it's referenced somewhere.
+    """
+
+    def __init__(self, genius) -> None:
+        self.genius = genius
+        self.objects: WeakValueDictionary[Tuple[type, int], Base] = (
+            WeakValueDictionary()
+        )
+        # Reentrant, as building an object builds the ones it references.
+        self.lock = threading.RLock()
+        self.loads = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def get(self, cls: Type[T], data: Dict, full: bool = False) -> T:
+        """
+        Get the object of the given data, creating it if it doesn't exist.
+
+        Parameters
+        ----------
+        cls: type
+            Class of the object.
+        data: Dict
+            Data of the object, as returned by the api.
+        full: bool
+            Flag to indicate that the data is complete (not from a listing), so
+            an existing object that isn't fully loaded is refreshed with it.
+        """
+        key = (cls, data["id"])
+
+        with self.lock:
+            if (instance := self.objects.get(key)) is None:
+                instance = cls(self.genius, data)
+                self.objects[key] = instance
+                return instance
+
+        if full:
+            instance._refresh(data)
+
+        return instance
+
+    def load(self, instance: Base, fetch: Callable[[int], Dict]) -> None:
+        """
+        Load the full data of an object, fetched by a single thread while the
+        others that need it wait, without blocking the loads of other objects.
+
+        Parameters
+        ----------
+        instance: genius.classes.commons.Base
+            Object to load.
+        fetch: Callable[[int], Dict]
+            Function that retrieves the data of the object by its ID.
+        """
+
+        def load() -> None:
+            # Checked again, as another thread may have loaded it meanwhile.
+            if instance._fully_loaded_:
+                return
+
+            data = fetch(instance.id)
+
+            with instance._load_lock():
+                if not instance._fully_loaded_:
+                    instance.__init_extra_data__(data)
+                    instance._fully_loaded_ = True
+
+        key = f"{type(instance).__name__}/{instance.id}"
+        self.loads.call(key, load)
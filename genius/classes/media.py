@@ -13,6 +13,12 @@ class Media(Base):
         url of the media.
     """
 
+    __slots__ = (
+        "provider",
+        "type",
+        "url",
+    )
+
     def __init__(self, genius, data):
         super().__init__(genius)
 
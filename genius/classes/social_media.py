@@ -10,6 +10,11 @@ class SocialMedia:
         url in the network.
     """
 
+    __slots__ = (
+        "handle",
+        "network",
+    )
+
     _fully_loaded_: bool = False
 
     def __init__(self, network, handle):
@@ -1,21 +1,34 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
 
-from genius.scraper import get_lyrics
 from .album import Album
 from .artist import Artist
 from .commons import Base
 from .media import Media
 
+# Fields of the data of a song that are kept raw until they are accessed.
+_DETAILS = (
+    "album",
+    "apple_music_id",
+    "featured_artists",
+    "media",
+    "primary_artists",
+    "producer_artists",
+    "recording_location",
+    "release_date",
+    "release_date_for_display",
+    "writer_artists",
+)
+
 
 def lazy_property(prop):
     @property
+    @wraps(prop)
     def wrapper(*args):
         self = args[0]
         if not self._fully_loaded_:
-            data = self.genius.api.get_song(self.id)
-            self.__init_extra_data__(data)
-            self._fully_loaded_ = True
+            self.genius.identity.load(self, self.genius.api.get_song)
         return prop(self)
 
     return wrapper
@@ -91,12 +104,25 @@ class Song(Base):
         **the attributes marked with a * will trigger one extra call to the api.**
     """
 
+    __slots__ = (
+        "id",
+        "artist",
+        "hot",
+        "pageviews",
+        "song_art_image_url",
+        "title",
+        "title_with_featured",
+        "url",
+        "__details",
+        "__values",
+    )
+
     def __init__(self, genius, data):
         super().__init__(genius)
         stats = data.get("stats", {})
 
         self.id: int = data["id"]
-        self.artist: "Artist" = Artist(self.genius, data["primary_artist"])
+        self.artist: "Artist" = self.genius._artist(data["primary_artist"])
         self.hot: bool = stats.get("hot", False)
         self.pageviews: int = stats.get("pageviews", 0)
         self.song_art_image_url: str = data.get("song_art_image_url")
@@ -107,27 +133,49 @@ class Song(Base):
         self.__init_extra_data__(data)
 
     def __init_extra_data__(self, data):
-        album = data.get("album")
-        if album:
-            album = Album(self.genius, album)
-
-        release_date = data.get("release_date")
-        if release_date:
-            release_date = datetime.strptime(release_date, "%Y-%m-%d")
-
-        self.__album: Optional[Album] = album
-        self.__description: str = data.get("description", {}).get("plain")
-        self.__recording_location: str = data.get("recording_location")
-        self.__release_date: Optional[datetime] = release_date
-        self.__release_date_for_display: str = data.get("release_date_for_display")
-
-        self.__media: Dict[str, Media] = dict(
-            map(lambda m: (m["provider"], Media(self.genius, m)), data.get("media", []))
+        # Only the raw details are kept, each one until it's built the first
+        # time it's accessed (the rest of the data is dropped).
+        details = {key: data[key] for key in _DETAILS if data.get(key)}
+
+        if description := data.get("description", {}).get("plain"):
+            details["description"] = description
+
+        for relationship in data.get("song_relationships", []):
+            if relationship.get("songs"):
+                details[relationship["type"]] = relationship["songs"]
+
+        self.__details: Dict[str, Any] = details
+        self.__values: Optional[Dict[str, Any]] = None
+
+    def __detail(self, name: str, build: Callable[[Dict], Any]) -> Any:
+        values = self.__values
+
+        if values is None or name not in values:
+            with self._load_lock():
+                if self.__values is None:
+                    self.__values = {}
+
+                values = self.__values
+
+                # Checked again, as the raw data is dropped once it's built.
+                if name not in values:
+                    values[name] = build(self.__details)
+
+        return values[name]
+
+    def __build_album(self, data: Dict) -> Optional[Album]:
+        album = data.pop("album", None)
+
+        return self.genius._album(album) if album else None
+
+    def __build_media(self, data: Dict) -> Dict[str, Media]:
+        media = dict(
+            map(lambda m: (m["provider"], Media(self.genius, m)), data.pop("media", []))
         )
 
-        apple_music_id = data.get("apple_music_id")
+        apple_music_id = data.pop("apple_music_id", None)
         if apple_music_id:
-            self.__media["apple-music"] = Media(
+            media["apple-music"] = Media(
                 genius=self.genius,
                 data={
                     "provider": "apple music",
@@ -136,125 +184,107 @@ class Song(Base):
                 },
             )
 
-        self.__artists: List["Artist"] = list(
-            map(lambda fa: Artist(self.genius, fa), data.get("primary_artists", []))
-        )
-        self.__features: List["Artist"] = list(
-            map(lambda fa: Artist(self.genius, fa), data.get("featured_artists", []))
-        )
-        self.__producers: List["Artist"] = list(
-            map(lambda pa: Artist(self.genius, pa), data.get("producer_artists", []))
-        )
-        self.__writers: List["Artist"] = list(
-            map(lambda wa: Artist(self.genius, wa), data.get("writer_artists", []))
-        )
+        return media
 
-        for relationship in data.get("song_relationships", []):
-            type_ = relationship["type"]
-            songs = list(
-                map(lambda rs: Song(self.genius, rs), relationship.get("songs", []))
-            )
+    def __artists_of(self, field: str) -> List["Artist"]:
+        return self.__detail(
+            field,
+            lambda data: list(map(self.genius._artist, data.pop(field, []))),
+        )
 
-            if type_ == "samples":
-                self.__samples: List["Song"] = songs
-            elif type_ == "sampled_in":
-                self.__sampled_in: List["Song"] = songs
-            elif type_ == "interpolates":
-                self.__interpolates: List["Song"] = songs
-            elif type_ == "interpolated_by":
-                self.__interpolated_by: List["Song"] = songs
-            elif type_ == "cover_of":
-                self.__cover_of: List["Song"] = songs
-            elif type_ == "covered_by":
-                self.__covered_by: List["Song"] = songs
-            elif type_ == "remix_of":
-                self.__remix_of: List["Song"] = songs
-            elif type_ == "remixed_by":
-                self.__remixed_by: List["Song"] = songs
-            elif type_ == "live_version_of":
-                self.__live_version_of: List["Song"] = songs
-            elif type_ == "performed_live_as":
-                self.__performed_live_as: List["Song"] = songs
+    def __songs_of(self, type_: str) -> List["Song"]:
+        return self.__detail(
+            type_,
+            lambda data: list(map(self.genius._song, data.pop(type_, []))),
+        )
 
     @lazy_property
     def description(self) -> str:
-        return self.__description
+        return self.__details.get("description")
 
     @lazy_property
     def recording_location(self) -> str:
-        return self.__recording_location
+        return self.__details.get("recording_location")
 
     @lazy_property
     def release_date(self) -> datetime:
-        return self.__release_date
+        def build(data: Dict) -> Optional[datetime]:
+            release_date = data.pop("release_date", None)
+
+            if release_date:
+                return datetime.strptime(release_date, "%Y-%m-%d")
+
+            return None
+
+        return self.__detail("release_date", build)
 
     @lazy_property
     def release_date_for_display(self) -> str:
-        return self.__release_date_for_display
+        return self.__details.get("release_date_for_display")
 
     @lazy_property
     def album(self) -> "Album":
-        return self.__album
+        return self.__detail("album", self.__build_album)
 
     @lazy_property
     def media(self) -> Dict[str, Media]:
-        return self.__media
+        return self.__detail("media", self.__build_media)
 
     @lazy_property
     def artists(self) -> List["Artist"]:
-        return self.__artists
+        return self.__artists_of("primary_artists")
 
     @lazy_property
     def features(self) -> List["Artist"]:
-        return self.__features
+        return self.__artists_of("featured_artists")
 
     @lazy_property
     def producers(self) -> List["Artist"]:
-        return self.__producers
+        return self.__artists_of("producer_artists")
 
     @lazy_property
     def writers(self) -> List["Artist"]:
-        return self.__writers
+        return self.__artists_of("writer_artists")
 
     @lazy_property
     def samples(self) -> List["Song"]:
-        return self.__samples
+        return self.__songs_of("samples")
 
     @lazy_property
     def sampled_in(self) -> List["Song"]:
-        return self.__sampled_in
+        return self.__songs_of("sampled_in")
 
     @lazy_property
     def interpolates(self) -> List["Song"]:
-        return self.__interpolates
+        return self.__songs_of("interpolates")
 
     @lazy_property
     def interpolated_by(self) -> List["Song"]:
-        return self.__interpolated_by
+        return self.__songs_of("interpolated_by")
 
     @lazy_property
     def cover_of(self) -> List["Song"]:
-        return self.__cover_of
+        return self.__songs_of("cover_of")
 
     @lazy_property
     def covered_by(self) -> List["Song"]:
-        return self.__covered_by
+        return self.__songs_of("covered_by")
 
     @lazy_property
     def remix_of(self) -> List["Song"]:
-        return self.__remix_of
+        return self.__songs_of("remix_of")
 
     @lazy_property
     def remixed_by(self) -> List["Song"]:
-        return self.__remixed_by
+        return self.__songs_of("remixed_by")
 
     @lazy_property
     def live_version_of(self) -> List["Song"]:
-        return self.__live_version_of
+        return self.__songs_of("live_version_of")
 
     @lazy_property
     def performed_live_as(self) -> List["Song"]:
-        return self.__performed_live_as
+        return self.__songs_of("performed_live_as")
 
     @property
     def is_cover(self):
@@ -271,14 +301,15 @@ class Song(Base):
     @property
     def lyrics(self) -> List[str]:
         """
-        Fetch the lyrics of the song using a scraper.
+        Fetch the lyrics of the song using a scraper, or from the cache of
+        the client.
 
         Returns
         -------
         List[str]
             Lines of the lyrics.
         """
-        return get_lyrics(self.url)
+        return self.genius._lyrics(self.url)
 
     def __repr__(self):  # pragma: no cover
         return f"{self.title} ({self.id})"
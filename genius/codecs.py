@@ -0,0 +1,116 @@
+import gzip
+import json
+import zlib
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+# Entries written by a codec start with this header, followed by one byte for the
+# serializer and one for the compression. Entries without it are plain json.
+MAGIC = b"GNC\x01"
+
+SERIALIZERS = {"json": b"j", "msgpack": b"m"}
+COMPRESSIONS = {None: b"-", "zlib": b"z", "gzip": b"g"}
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson:
+        return orjson.dumps(value)
+
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _loads(data: bytes) -> Any:
+    if orjson:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def _msgpack():
+    if msgpack is None:  # pragma: no cover
+        raise ImportError("the msgpack serializer requires msgpack to be installed")
+
+    return msgpack
+
+
+class Codec:
+    """
+    Compact storage format of the cached responses.
+
+    Responses are serialized as minified json (using orjson when installed) or
+    msgpack, and compressed with zlib or gzip.
+    """
+
+    def __init__(
+        self,
+        serializer: str = "json",
+        compression: Optional[str] = "zlib",
+        level: int = 6,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        serializer: str
+            Serialization format (json/msgpack).
+        compression: str
+            Compression algorithm (zlib/gzip), or None to store them uncompressed.
+        level: int
+            Compression level, from 1 (fastest) to 9 (smallest).
+        """
+        assert serializer in SERIALIZERS
+        assert compression in COMPRESSIONS
+
+        self.serializer: str = serializer
+        self.compression: Optional[str] = compression
+        self.level: int = level
+
+        self.header: bytes = MAGIC + SERIALIZERS[serializer] + COMPRESSIONS[compression]
+
+    def encode(self, value: Dict[str, Any]) -> bytes:
+        if self.serializer == "msgpack":
+            data = _msgpack().packb(value)
+        else:
+            data = _dumps(value)
+
+        if self.compression == "zlib":
+            data = zlib.compress(data, self.level)
+        elif self.compression == "gzip":
+            data = gzip.compress(data, self.level, mtime=0)
+
+        return self.header + data
+
+    @staticmethod
+    def decode(data: bytes | str) -> Dict[str, Any]:
+        """
+        Decode an entry written by any codec, or a plain json one.
+
+        Raises ValueError if the entry is corrupted.
+        """
+        if isinstance(data, str) or not data.startswith(MAGIC):
+            return _loads(data)
+
+        serializer, compression = data[4:5], data[5:6]
+        data = data[6:]
+
+        try:
+            if compression == COMPRESSIONS["zlib"]:
+                data = zlib.decompress(data)
+            elif compression == COMPRESSIONS["gzip"]:
+                data = gzip.decompress(data)
+        except (zlib.error, EOFError, OSError) as exc:
+            # Truncated or corrupted, like the entries that can't be deserialized.
+            raise ValueError(f"corrupted cache entry: {exc}") from exc
+
+        if serializer == SERIALIZERS["msgpack"]:
+            return _msgpack().unpackb(data)
+
+        return _loads(data)
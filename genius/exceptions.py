@@ -5,3 +5,10 @@ class APIException(Exception):
         self.url = url
 
         super().__init__(f"{self.status} > {self.message}")
+
+
+class DeadlineExceeded(Exception):
+    def __init__(self, deadline):
+        self.deadline = deadline
+
+        super().__init__(f"deadline of {self.deadline}s exceeded")
@@ -0,0 +1,238 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from genius.bulk import ErrorHandler, fetch_many
+
+# Types of the relationships between songs, as named by the api.
+RELATIONSHIPS = (
+    "samples",
+    "sampled_in",
+    "interpolates",
+    "interpolated_by",
+    "cover_of",
+    "covered_by",
+    "remix_of",
+    "remixed_by",
+    "live_version_of",
+    "performed_live_as",
+)
+
+
+class Edge(NamedTuple):
+    """Relationship of a type from a song to another."""
+
+    source: int
+    target: int
+    type: str
+
+
+def edges_of(song: Dict[str, Any], types: Collection[str]) -> Iterator[Edge]:
+    """
+    Relationships of the selected types of a song, as returned by the api.
+    """
+    for relationship in song.get("song_relationships", []):
+        if relationship["type"] not in types:
+            continue
+
+        for target in relationship.get("songs", []):
+            yield Edge(song["id"], target["id"], relationship["type"])
+
+
+class EdgeStore:
+    """
+    Adjacency list of a graph of songs, stored in a sqlite database.
+
+    Edges are clustered by their source (a table without rowid), so the
+    neighbors of a song are read from consecutive pages even with millions of
+    edges, and indexed by their target to also walk the graph backwards.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """
+        Parameters
+        ----------
+        path: str
+            Path of the database file, the edges are kept in memory if not set.
+        """
+        self.path: str = str(path)
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS edges "
+                "(source INTEGER, type TEXT, target INTEGER, "
+                "PRIMARY KEY (source, type, target)) WITHOUT ROWID"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS edges_target ON edges (target)"
+            )
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
+
+    def add(self, edges: Iterable[Edge]) -> None:
+        """
+        Store several edges at once, the ones already stored are ignored.
+        """
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO edges (source, type, target) VALUES (?, ?, ?)",
+                [(edge.source, edge.type, edge.target) for edge in edges],
+            )
+
+    def neighbors(
+        self,
+        song_id: int,
+        types: Optional[Collection[str]] = None,
+        reverse: bool = False,
+    ) -> List[Edge]:
+        """
+        Edges of a song.
+
+        Parameters
+        ----------
+        song_id: int
+            ID of the song.
+        types: Collection[str]
+            Types of the relationships to include, all of them if not set.
+        reverse: bool
+            Flag to get the edges that point to the song, instead of the ones
+            that start from it.
+
+        Returns
+        -------
+        List[genius.graph.Edge]
+        """
+        column = "target" if reverse else "source"
+
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT source, target, type FROM edges WHERE {column} = ?",
+                (song_id,),
+            ).fetchall()
+
+        return [Edge(*row) for row in rows if types is None or row[2] in types]
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+def crawl(
+    fetch: Callable[[int], Optional[Dict[str, Any]]],
+    seeds: Iterable[int],
+    types: Collection[str] = RELATIONSHIPS,
+    max_depth: int = 2,
+    max_nodes: int = 1000,
+    workers: int = 8,
+    store: Optional[EdgeStore] = None,
+    on_error: Optional[ErrorHandler] = None,
+    cached: Optional[Callable[[int], Optional[Dict[str, Any]]]] = None,
+) -> Iterator[Edge]:
+    """
+    Breadth-first crawl of the relationships between songs.
+
+    Every level of the graph is fetched concurrently, and the edges of each
+    song are yielded (and stored) as soon as it's fetched. Each song is fetched
+    once, and once the budget of nodes is reached the edges that would add a
+    new song to the graph are discarded.
+
+    Parameters
+    ----------
+    fetch: Callable
+        Function that retrieves the data of a song by its ID.
+    seeds: Iterable[int]
+        IDs of the songs to start from.
+    types: Collection[str]
+        Types of the relationships to follow (see genius.graph.RELATIONSHIPS).
+    max_depth: int
+        Maximum amount of relationships between the seeds and any other song.
+    max_nodes: int
+        Maximum amount of songs in the graph, including the seeds.
+    workers: int
+        Maximum amount of simultaneous requests.
+    store: genius.graph.EdgeStore
+        Store where the edges are written as they are found.
+    on_error: Callable[[int, Exception], None]
+        Function called with the ID and the exception of every song that
+        couldn't be retrieved, failures are logged and skipped if not provided.
+    cached: Callable
+        Function that returns the data of a song if it's already available.
+
+    Yields
+    -------
+    genius.graph.Edge
+    """
+    assert max_depth >= 0
+    assert max_nodes > 0
+
+    types = frozenset(types)
+    visited: Set[int] = set()
+
+    def visit(song_id: int, level: List[int]) -> bool:
+        if song_id in visited:
+            return True
+
+        if len(visited) >= max_nodes:
+            return False
+
+        visited.add(song_id)
+        level.append(song_id)
+        return True
+
+    level: List[int] = []
+
+    for seed in seeds:
+        visit(seed, level)
+
+    for _ in range(max_depth):
+        next_level: List[int] = []
+        songs: Iterator[Tuple[int, Optional[Dict[str, Any]]]] = fetch_many(
+            fetch,
+            level,
+            workers=workers,
+            ordered=False,
+            on_error=on_error,
+            cached=cached,
+        )
+
+        for _, song in songs:
+            if not song:
+                continue
+
+            edges = [
+                edge for edge in edges_of(song, types) if visit(edge.target, next_level)
+            ]
+
+            if store is not None and edges:
+                store.add(edges)
+
+            yield from edges
+
+        if not next_level:
+            break
+
+        level = next_level
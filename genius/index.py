@@ -0,0 +1,218 @@
+import json
+import re
+import sqlite3
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+_WORDS = re.compile(r"\w+")
+
+
+class SearchSource(str, Enum):
+    """Valid sources of the searches."""
+
+    API = "api"
+    LOCAL = "local"
+
+    def __str__(self):  # pragma: no cover
+        return self.value
+
+
+def songs_of(response: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Songs included in a response of the api.
+    """
+    if song := response.get("song"):
+        yield song
+
+    for hit in response.get("hits", []):
+        if hit.get("type", "song") == "song" and hit.get("result"):
+            yield hit["result"]
+
+    yield from response.get("songs", [])
+
+    for track in response.get("tracks", []):
+        if track.get("song"):
+            yield track["song"]
+
+
+class SearchIndex:
+    """
+    Local full-text index of the songs and lyrics retrieved by a client, stored
+    in a sqlite database with the fts5 extension.
+
+    It's updated with every response fetched from the api and with the lyrics
+    scraped, so once a catalog has been crawled it can be searched offline.
+    Songs are indexed by their title, the names of their artists and their
+    lyrics, keeping the most complete data seen for each one.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """
+        Parameters
+        ----------
+        path: str
+            Path of the database file, the index is kept in memory if not set.
+        """
+        self.path: str = str(path)
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False
+        )
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS songs "
+                "(id INTEGER PRIMARY KEY, url TEXT, data TEXT)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS songs_url ON songs (url)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS lyrics (url TEXT PRIMARY KEY, text TEXT)"
+            )
+            self.connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS songs_fts USING fts5"
+                "(title, artists, lyrics, tokenize='unicode61 remove_diacritics 2')"
+            )
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM songs").fetchone()[0]
+
+    def add(self, response: Dict[str, Any]) -> None:
+        """
+        Index the songs included in a response of the api.
+
+        Parameters
+        ----------
+        response: Dict[str, Any]
+            Response of the api.
+        """
+        songs = list(songs_of(response))
+
+        if not songs:
+            return
+
+        with self.lock, self.connection:
+            for song in songs:
+                self._add_song(song)
+
+    def add_lyrics(self, url: str, lines: List[str]) -> None:
+        """
+        Index the lyrics of a song, which can be scraped before or after the
+        song is indexed.
+
+        Parameters
+        ----------
+        url: str
+            Url of the song in genius.
+        lines: List[str]
+            Lines of the lyrics.
+        """
+        text = "\n".join(lines)
+
+        with self.lock, self.connection:
+            row = self.connection.execute(
+                "SELECT text FROM lyrics WHERE url = ?", (url,)
+            ).fetchone()
+
+            if row and row[0] == text:
+                return
+
+            self.connection.execute(
+                "INSERT OR REPLACE INTO lyrics (url, text) VALUES (?, ?)", (url, text)
+            )
+
+            rows = self.connection.execute(
+                "SELECT data FROM songs WHERE url = ?", (url,)
+            ).fetchall()
+
+            for (data,) in rows:
+                self._write_fts(json.loads(data), text)
+
+    def search(
+        self, text: str, page: int = 1, per_page: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the indexed songs, ranked by relevance.
+
+        Parameters
+        ----------
+        text: str
+            Text to search, every word has to be in the title, the artists or
+            the lyrics of the songs.
+        page: int
+            Desired page.
+        per_page: int
+            Amount of songs per page.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Data of the songs, like the api returns them.
+        """
+        # Every word is quoted, so the operators of fts5 can't be injected.
+        query = " ".join(f'"{word}"' for word in _WORDS.findall(text))
+
+        if not query:
+            return []
+
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT songs.data FROM songs_fts "
+                "JOIN songs ON songs.id = songs_fts.rowid "
+                "WHERE songs_fts MATCH ? ORDER BY rank LIMIT ? OFFSET ?",
+                (query, per_page, (page - 1) * per_page),
+            ).fetchall()
+
+        return [json.loads(data) for (data,) in rows]
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+    def _add_song(self, song: Dict[str, Any]) -> None:
+        row = self.connection.execute(
+            "SELECT data FROM songs WHERE id = ?", (song["id"],)
+        ).fetchone()
+
+        # Songs of the searches and listings have less fields than the full ones.
+        if row:
+            stored = json.loads(row[0])
+            song = {**stored, **song}
+
+            # Responses read again from the cache don't change the index.
+            if song == stored:
+                return
+
+        self.connection.execute(
+            "INSERT OR REPLACE INTO songs (id, url, data) VALUES (?, ?, ?)",
+            (song["id"], song.get("url"), json.dumps(song)),
+        )
+
+        row = self.connection.execute(
+            "SELECT text FROM lyrics WHERE url = ?", (song.get("url"),)
+        ).fetchone()
+
+        self._write_fts(song, row[0] if row else None)
+
+    def _write_fts(self, song: Dict[str, Any], lyrics: Optional[str]) -> None:
+        artists = [song.get("primary_artist") or {}]
+        artists += song.get("featured_artists") or []
+
+        self.connection.execute("DELETE FROM songs_fts WHERE rowid = ?", (song["id"],))
+        self.connection.execute(
+            "INSERT INTO songs_fts (rowid, title, artists, lyrics) VALUES (?, ?, ?, ?)",
+            (
+                song["id"],
+                song.get("title"),
+                " ".join(artist.get("name") or "" for artist in artists),
+                lyrics,
+            ),
+        )
@@ -0,0 +1,134 @@
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Deque, Iterator, List, Optional, TypeVar
+
+from genius.exceptions import DeadlineExceeded
+
+T = TypeVar("T")
+
+
+class _Deadline:
+    def __init__(self, seconds: Optional[float]) -> None:
+        self.seconds: Optional[float] = seconds
+        self.expires: Optional[float] = time.monotonic() + seconds if seconds else None
+
+    def remaining(self) -> Optional[float]:
+        """
+        Seconds left (None without deadline), raises DeadlineExceeded if none.
+        """
+        if self.expires is None:
+            return None
+
+        if (remaining := self.expires - time.monotonic()) <= 0:
+            raise DeadlineExceeded(self.seconds)
+
+        return remaining
+
+
+def paginate(
+    fetch: Callable[[int], List[T]],
+    prefetch: int = 0,
+    page_limit: Optional[int] = None,
+    deadline: Optional[float] = None,
+    partial: bool = False,
+) -> Iterator[T]:
+    """
+    Iterate over the items of a paginated service until the first empty page.
+
+    Parameters
+    ----------
+    fetch: Callable[[int], List]
+        Function that retrieves the items of a page (starting from 1).
+    prefetch: int
+        Amount of pages to fetch ahead of the one being consumed, using a pool of
+        threads. The pages are fetched one by one if not set.
+    page_limit: int
+        Limit of pages to fetch.
+    deadline: float
+        Seconds to iterate for, counted from the first page. It's checked before
+        every page (requests in flight are bounded by their own timeouts).
+    partial: bool
+        Flag to stop silently when the deadline expires, keeping the items
+        yielded so far, instead of raising DeadlineExceeded.
+
+    Yields
+    -------
+    Item of the page, in the order of the pages.
+    """
+    try:
+        if prefetch:
+            yield from _prefetch(fetch, prefetch, page_limit, _Deadline(deadline))
+        else:
+            yield from _sequential(fetch, page_limit, _Deadline(deadline))
+    except DeadlineExceeded:
+        if not partial:
+            raise
+
+
+def _sequential(
+    fetch: Callable[[int], List[T]],
+    page_limit: Optional[int],
+    deadline: _Deadline,
+) -> Iterator[T]:
+    page = 0
+
+    while True:
+        page += 1
+
+        if page_limit and page > page_limit:
+            break
+
+        deadline.remaining()
+        items = fetch(page)
+
+        if not items:
+            break
+
+        yield from items
+
+
+def _prefetch(
+    fetch: Callable[[int], List[T]],
+    prefetch: int,
+    page_limit: Optional[int],
+    deadline: _Deadline,
+) -> Iterator[T]:
+    executor = ThreadPoolExecutor(
+        max_workers=prefetch,
+        thread_name_prefix="genius-prefetch",
+    )
+    pending: Deque[Future] = deque()
+    page = 0
+
+    def submit():
+        nonlocal page
+
+        if page_limit and page >= page_limit:
+            return
+
+        page += 1
+        pending.append(executor.submit(fetch, page))
+
+    try:
+        for _ in range(prefetch):
+            submit()
+
+        while pending:
+            try:
+                items = pending.popleft().result(timeout=deadline.remaining())
+            except FutureTimeoutError:
+                raise DeadlineExceeded(deadline.seconds) from None
+
+            if not items:
+                break
+
+            submit()
+            yield from items
+    finally:
+        # Also reached when the consumer stops iterating (GeneratorExit).
+        for future in pending:
+            future.cancel()
+
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,139 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Status codes the api answers with when it's receiving too many requests.
+THROTTLING_STATUSES = (429, 503)
+
+
+def retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse the value of a Retry-After header, either seconds or an http date.
+
+    Returns
+    -------
+    float
+        Seconds to wait, None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all the callers of an api, which adapts its rate.
+
+    The rate is halved every time the api throttles a request, all callers are
+    paused for as long as the api asks to with Retry-After, and then the rate
+    recovers gradually with every successful request, up to the configured one.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = 10,
+        burst: int = 1,
+        min_rate: float = 0.5,
+        recovery: float = 0.05,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        rate: float
+            Maximum requests per second, unlimited if not set (the pauses
+            requested by the api are still honored).
+        burst: int
+            Amount of requests that can be made at once after being idle.
+        min_rate: float
+            Lowest requests per second the rate can be reduced to.
+        recovery: float
+            Fraction of the maximum rate recovered with every successful request.
+        """
+        assert rate is None or rate > 0
+        assert burst > 0
+
+        self.max_rate: Optional[float] = rate
+        self.rate: Optional[float] = rate
+        self.burst: int = burst
+        self.min_rate: float = min(min_rate, rate) if rate else min_rate
+        self.recovery: float = recovery
+
+        self.throttles: int = 0
+        self.lock = threading.Lock()
+        self.next_slot: float = 0.0
+        self.paused_until: float = 0.0
+
+    @property
+    def current_rate(self) -> Optional[float]:
+        """
+        Requests per second currently allowed (None when unlimited).
+        """
+        return self.rate
+
+    def reserve(self) -> float:
+        """
+        Reserve a slot for a request.
+
+        Returns
+        -------
+        float
+            Seconds to wait before making the request.
+        """
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.paused_until)
+
+            if self.rate:
+                interval = 1 / self.rate
+                slot = max(slot, self.next_slot - (self.burst - 1) * interval)
+                self.next_slot = max(slot, self.next_slot) + interval
+
+            return slot - now
+
+    def acquire(self) -> None:
+        """
+        Wait until a request can be made.
+        """
+        if delay := self.reserve():
+            time.sleep(delay)
+
+    def throttled(self, delay: Optional[float] = None) -> None:
+        """
+        Slow down after the api throttled a request.
+
+        Parameters
+        ----------
+        delay: float
+            Seconds the api asked to wait before the next request.
+        """
+        with self.lock:
+            self.throttles += 1
+
+            if self.rate:
+                self.rate = max(self.min_rate, self.rate / 2)
+
+            if delay:
+                self.paused_until = max(self.paused_until, time.monotonic() + delay)
+
+    def succeeded(self) -> None:
+        """
+        Recover part of the rate after a successful request.
+        """
+        if self.rate is None or self.rate == self.max_rate:
+            return
+
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery)
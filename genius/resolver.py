@@ -0,0 +1,241 @@
+import re
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+
+from unidecode import unidecode
+
+from genius.bulk import ErrorHandler, fetch_many
+from genius.results import ResultMode
+
+if TYPE_CHECKING:  # pragma: no cover
+    from genius.api import Genius
+
+# Service under which the resolved names are kept in the cache of the client.
+RESOLVER_SERVICE = "artist_names"
+
+# Fields of the search results needed to match the artists.
+FIELDS = ("primary_artist.id", "primary_artist.name")
+
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize(name: str) -> str:
+    """
+    Normalize the name of an artist to compare it with others, transliterated
+    to ascii, casefolded and without punctuation nor spaces (e.g. "Beyoncé" ->
+    "beyonce", "Jay-Z" -> "jayz"). Names made only of punctuation are just
+    casefolded (e.g. "!!!").
+    """
+    normalized = _SEPARATORS.sub("", unidecode(name).casefold())
+
+    return normalized or name.strip().casefold()
+
+
+class ArtistResolver:
+    """
+    Resolves the names of the artists to their IDs, with as few requests to the
+    api as possible.
+
+    The search stops at the first page with a result whose primary artist
+    matches the name, preferring the artists with exactly the same name over
+    the ones that only match once normalized, and then the best ranked. The
+    names of all the artists seen along the way are indexed, so most of the
+    later lookups don't need a request. When no result matches, the alternate
+    names of the first artists found are checked as well.
+
+    Resolved names are kept in memory and in the cache of the client (under the
+    "artist_names" service), so they persist between runs when the cache does.
+    Names shared by several artists are only kept when they match one of them
+    exactly, and names without a match are only kept for a while, as the
+    artist could be added to genius later.
+    """
+
+    def __init__(
+        self,
+        genius: "Genius",
+        page_limit: int = 3,
+        candidates: int = 3,
+        miss_ttl: float = 86400,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        genius: genius.api.Genius
+            Client used to search the artists.
+        page_limit: int
+            Limit of pages of the search for each name.
+        candidates: int
+            Amount of artists found in the search whose alternate names are
+            checked when none of them has the exact name.
+        miss_ttl: float
+            Seconds to keep the names without a match in the cache.
+        """
+        self.genius = genius
+        self.page_limit: int = page_limit
+        self.candidates: int = candidates
+        self.miss_ttl: float = miss_ttl
+
+        # Resolved names, and the names of the artists seen in the searches.
+        self.names: Dict[str, Optional[int]] = {}
+        self.seen: Dict[str, int] = {}
+        self.ambiguous: Set[str] = set()
+        self.lock = threading.Lock()
+
+    def learn(self, name: str, artist_id: int) -> None:
+        normalized = normalize(name)
+
+        if not normalized:
+            return
+
+        # Names seen for several artists are left to the search to resolve.
+        with self.lock:
+            if self.seen.setdefault(normalized, artist_id) != artist_id:
+                self.ambiguous.add(normalized)
+
+    def remember(self, name: str, artist_id: Optional[int]) -> Optional[int]:
+        with self.lock:
+            self.names[name] = artist_id
+
+        self.genius.api.cache.save(
+            RESOLVER_SERVICE,
+            {"id": artist_id},
+            ttl=self.miss_ttl if artist_id is None else None,
+            name=name,
+        )
+
+        return artist_id
+
+    def lookup(self, name: str) -> Optional[Dict[str, Optional[int]]]:
+        with self.lock:
+            if self.names.get(name) is not None:
+                return {"id": self.names[name]}
+
+            if name in self.seen and name not in self.ambiguous:
+                return {"id": self.seen[name]}
+
+            if name in self.names:
+                return {"id": None}
+
+        return self.genius.api.cache.load(RESOLVER_SERVICE, name=name)
+
+    def matched(self, name: str, matches: List[int]) -> int:
+        with self.lock:
+            ambiguous = len(matches) > 1 or name in self.ambiguous
+
+        # Only remembered when no other artist has the same name.
+        return matches[0] if ambiguous else self.remember(name, matches[0])
+
+    def resolve(self, name: str) -> Optional[int]:
+        """
+        Resolve the name of an artist to its ID.
+
+        Parameters
+        ----------
+        name: str
+            Name of the artist, or one of its alternate names.
+
+        Returns
+        -------
+        int
+            ID of the artist, None if no artist matches the name.
+        """
+        normalized = normalize(name)
+
+        if not normalized:
+            return None
+
+        if (known := self.lookup(normalized)) is not None:
+            return known["id"]
+
+        exact = name.strip().casefold()
+        matches: List[int] = []
+        candidates: List[int] = []
+
+        for page in range(1, self.page_limit + 1):
+            results = list(
+                self.genius.search(name, page=page, mode=ResultMode.RAW, fields=FIELDS)
+            )
+
+            for result in results:
+                artist_id = result["primary_artist.id"]
+                artist_name = result["primary_artist.name"]
+
+                if artist_id is None or artist_name is None:
+                    continue
+
+                self.learn(artist_name, artist_id)
+
+                if artist_name.strip().casefold() == exact:
+                    return self.remember(normalized, artist_id)
+
+                if normalize(artist_name) != normalized:
+                    if artist_id not in candidates:
+                        candidates.append(artist_id)
+                elif artist_id not in matches:
+                    matches.append(artist_id)
+
+            if matches or not results:
+                break
+
+        if matches:
+            return self.matched(normalized, matches)
+
+        for artist_id in candidates[: self.candidates]:
+            artist = self.genius.api.get_artist(artist_id) or {}
+
+            for alternate_name in artist.get("alternate_names", []):
+                self.learn(alternate_name, artist_id)
+
+                if normalize(alternate_name) == normalized:
+                    return self.matched(normalized, [artist_id])
+
+        return self.remember(normalized, None)
+
+    def resolve_many(
+        self,
+        names: Iterable[str],
+        workers: int = 8,
+        on_error: Optional[ErrorHandler] = None,
+    ) -> Dict[str, Optional[int]]:
+        """
+        Resolve the names of several artists concurrently, searching once for
+        the names that are equal once normalized.
+
+        Parameters
+        ----------
+        names: Iterable[str]
+            Names of the artists.
+        workers: int
+            Maximum amount of simultaneous searches.
+        on_error: Callable[[str, Exception], None]
+            Function called with the name and the exception of every name that
+            couldn't be resolved, failures are logged and skipped if not provided.
+
+        Returns
+        -------
+        Dict[str, int]
+            ID of the artist of each name, None for the names without a match.
+        """
+        names = [(name, normalize(name)) for name in names]
+
+        # Names that are equal once normalized are searched once, by the first.
+        searched: Dict[str, str] = {}
+
+        for name, normalized in names:
+            searched.setdefault(normalized, name)
+
+        resolved = dict(
+            fetch_many(
+                self.resolve,
+                searched.values(),
+                workers=workers,
+                ordered=False,
+                on_error=on_error,
+            )
+        )
+
+        return {
+            name: resolved[searched[normalized]]
+            for name, normalized in names
+            if searched[normalized] in resolved
+        }
@@ -0,0 +1,81 @@
+from collections import namedtuple
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+# Fields of the tuples yielded when no projection is provided.
+DEFAULT_FIELDS = ("id", "title", "url", "primary_artist.id", "primary_artist.name")
+
+
+class ResultMode(str, Enum):
+    """Valid result modes."""
+
+    MODEL = "model"
+    RAW = "raw"
+    TUPLE = "tuple"
+
+    def __str__(self):  # pragma: no cover
+        return self.value
+
+
+@lru_cache(maxsize=128)
+def _record(fields: Tuple[str, ...]) -> type:
+    # Nested fields like "primary_artist.name" become "primary_artist_name",
+    # and the invalid or repeated ones are renamed to their position (e.g. "_1").
+    return namedtuple(
+        "Record", [field.replace(".", "_") for field in fields], rename=True
+    )
+
+
+def _get(data: Dict[str, Any], field: str) -> Any:
+    for name in field.split("."):
+        if not isinstance(data, dict):
+            return None
+
+        data = data.get(name)
+
+    return data
+
+
+def project(
+    items: Iterable[Dict[str, Any]],
+    mode: ResultMode,
+    fields: Optional[Sequence[str]] = None,
+) -> Iterator[Dict[str, Any] | tuple]:
+    """
+    Convert the items returned by the api to raw dictionaries or named tuples,
+    without building any model.
+
+    Parameters
+    ----------
+    items: Iterable[Dict]
+        Items returned by the api.
+    mode: genius.results.ResultMode
+        Result mode (raw/tuple).
+    fields: Sequence[str]
+        Fields to keep, nested ones separated by dots (e.g. "primary_artist.name").
+        Raw items are kept whole and tuples have the default fields if not set.
+        Fields that aren't valid names of a tuple are named by their position
+        (e.g. "_2").
+
+    Yields
+    -------
+    Dict | tuple
+    """
+    assert mode in (ResultMode.RAW, ResultMode.TUPLE)
+
+    if mode == ResultMode.RAW:
+        if not fields:
+            yield from items
+            return
+
+        for item in items:
+            yield {field: _get(item, field) for field in fields}
+
+        return
+
+    fields = tuple(fields or DEFAULT_FIELDS)
+    record = _record(fields)
+
+    for item in items:
+        yield record._make(_get(item, field) for field in fields)
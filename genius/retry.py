@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Collection, Dict, Optional, Tuple, Type
+
+import requests
+
+from genius.ratelimit import retry_after
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+RETRYABLE_EXCEPTIONS = (
+    ConnectionError,
+    TimeoutError,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+
+
+class RetryPolicy:
+    """
+    Policy to retry the requests that failed with a transient error, waiting an
+    exponential backoff with jitter between attempts.
+
+    The same policy can be shared by the api and the scraper, and it keeps
+    count of the retries and of the time spent waiting for them.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+        statuses: Collection[int] = RETRYABLE_STATUSES,
+        exceptions: Tuple[Type[BaseException], ...] = RETRYABLE_EXCEPTIONS,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        attempts: int
+            Maximum attempts for each request, including the first one.
+        backoff: float
+            Base seconds to wait, doubled after every attempt.
+        max_backoff: float
+            Maximum seconds to wait between two attempts.
+        statuses: Collection[int]
+            Status codes that are considered transient.
+        exceptions: Tuple[Type[BaseException]]
+            Exceptions that are considered transient.
+        deadline: float
+            Maximum seconds to spend on a request including all its attempts,
+            no retry is made if it would exceed them.
+        """
+        assert attempts > 0
+
+        self.attempts: int = attempts
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.statuses: Collection[int] = statuses
+        self.exceptions: Tuple[Type[BaseException], ...] = exceptions
+        self.deadline: Optional[float] = deadline
+
+        self.retries: int = 0
+        self.retry_time: float = 0.0
+        self.lock = threading.Lock()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Counters of the retries made with the policy.
+
+        Returns
+        -------
+        Dict[str, float]
+            retries and retry_time (seconds waited before retrying).
+        """
+        with self.lock:
+            return {"retries": self.retries, "retry_time": self.retry_time}
+
+    def retryable(self, exc: BaseException) -> bool:
+        if isinstance(exc, self.exceptions):
+            return True
+
+        return self.status(exc) in self.statuses
+
+    @staticmethod
+    def status(exc: BaseException) -> Optional[int]:
+        # Checked against None, as failed responses of requests are falsy.
+        if (response := getattr(exc, "response", None)) is not None:
+            return response.status_code
+
+        return getattr(exc, "status", None)
+
+    def delay(self, attempt: int, exc: BaseException) -> float:
+        """
+        Seconds to wait before the next attempt ("full jitter" backoff).
+        """
+        backoff = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        delay = random.uniform(0, backoff)
+
+        if (response := getattr(exc, "response", None)) is not None:
+            delay = max(delay, retry_after(response.headers.get("Retry-After")) or 0)
+
+        return delay
+
+    def next_delay(
+        self, attempt: int, exc: BaseException, start: float
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying a failed attempt, None to give up.
+        """
+        if attempt >= self.attempts or not self.retryable(exc):
+            return None
+
+        delay = self.delay(attempt, exc)
+
+        if self.deadline and time.monotonic() - start + delay > self.deadline:
+            return None
+
+        with self.lock:
+            self.retries += 1
+            self.retry_time += delay
+
+        logger.warning("Retrying in %.2fs after attempt %d: %s", delay, attempt, exc)
+
+        return delay
+
+    def call(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call a function, retrying it according to the policy.
+        """
+        start = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            try:
+                return function(*args, **kwargs)
+            except Exception as exc:
+                delay = self.next_delay(attempt, exc, start)
+
+                if delay is None:
+                    raise
+
+            time.sleep(delay)
+
+    async def call_async(
+        self, function: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """
+        Await a coroutine function, retrying it according to the policy.
+        """
+        start = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            try:
+                return await function(*args, **kwargs)
+            except Exception as exc:
+                delay = self.next_delay(attempt, exc, start)
+
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
@@ -1,63 +1,281 @@
 import logging
-from typing import List
+from html.parser import HTMLParser
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 import requests
-from bs4 import BeautifulSoup, NavigableString
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+
+from genius.cache import Cache
+from genius.retry import RetryPolicy
+from genius.session import DEFAULT_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
+try:
+    import lxml  # noqa: F401
+
+    PARSER = "lxml"
+except ImportError:  # pragma: no cover
+    PARSER = "html.parser"
+
+LYRICS_CONTAINER = {"data-lyrics-container": "true"}
+
+# Service of the cache where the lyrics are stored, keyed by the url of the song.
+LYRICS_SERVICE = "lyrics"
+
+# Seconds after which the cached lyrics are revalidated, unless the cache has a
+# ttl for them.
+LYRICS_MAX_AGE = 7 * 24 * 3600
+
+# Size of the chunks read from the song pages when streaming them.
+CHUNK_SIZE = 16 * 1024
+
+VOID_ELEMENTS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "source",
+    "track",
+    "wbr",
+}
+
+
+class _LyricsScanner(HTMLParser):
+    """
+    Incremental parser that detects when the lyrics containers of a page are
+    complete, which is when the element that contains them gets closed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+
+        self.stack: List[str] = []
+        self.parent: Optional[int] = None
+        self.complete: bool = False
 
-def _get_soup(url: str, lower=False) -> BeautifulSoup:
-    content = requests.get(url).text
+    def handle_starttag(self, tag, attrs):
+        if (
+            self.parent is None
+            and tag == "div"
+            and ("data-lyrics-container", "true") in attrs
+        ):
+            # Depth of the element that contains the lyrics containers.
+            self.parent = len(self.stack)
 
-    if lower:
-        content = content.lower()
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(tag)
 
-    return BeautifulSoup(content, features="html.parser")
+    def handle_endtag(self, tag):
+        if tag not in self.stack:
+            return
 
+        while self.stack.pop() != tag:
+            pass
 
-def _extract_lyrics(current) -> List[str]:
-    if type(current) is NavigableString:
-        return [str(current)]
+        if self.parent is not None and len(self.stack) < self.parent:
+            self.complete = True
 
-    if current.name == "br":
-        return ["\n"]
 
-    strings = []
+def _read_lyrics_html(chunks: Iterable[str]) -> str:
+    """
+    Read the chunks of a song page until its lyrics containers are complete.
+    """
+    scanner = _LyricsScanner()
+    content = []
+
+    for chunk in chunks:
+        content.append(chunk)
+        scanner.feed(chunk)
+
+        if scanner.complete:
+            break
+
+    return "".join(content)
+
+
+def _get_page(
+    url: str,
+    session: Optional[requests.Session] = None,
+    timeout: float | Tuple[float, float] | None = DEFAULT_TIMEOUT,
+    headers: Optional[Dict[str, str]] = None,
+    stream: bool = False,
+) -> Tuple[int, Mapping[str, str], str]:
+    with (session or requests).get(
+        url, timeout=timeout, headers=headers, stream=stream
+    ) as response:
+        response.raise_for_status()
 
-    for children in current.children:
-        strings += _extract_lyrics(children)
+        if not stream:
+            return response.status_code, response.headers, response.text
 
-    return strings
+        # Pages of genius declare their charset, which is needed to decode chunks.
+        response.encoding = response.encoding or "utf-8"
+        chunks = response.iter_content(CHUNK_SIZE, decode_unicode=True)
 
+        # Leaving early closes the connection instead of reading the rest.
+        return response.status_code, response.headers, _read_lyrics_html(chunks)
 
-def get_lyrics(url: str, attemps_left=3) -> List[str]:
+
+def _walk_lyrics(root) -> Iterator[str]:
+    # Depth-first traversal of the text and the line breaks, with a stack.
+    stack = [root]
+
+    while stack:
+        current = stack.pop()
+
+        if type(current) is NavigableString:
+            yield str(current)
+        elif current.name == "br":
+            yield "\n"
+        else:
+            stack.extend(reversed(list(current.children)))
+
+
+def _parse_lyrics(content: str) -> List[str]:
+    """
+    Extract the lines of the lyrics from the html of a song page.
+
+    Only the lyrics containers are parsed (using lxml when installed), which
+    gives the same lines as parsing the whole page with html.parser.
+    """
+    # lxml turns carriage returns into line breaks and html.parser keeps them,
+    # so those pages are parsed with html.parser to get the same lines.
+    parser = "html.parser" if "\r" in content else PARSER
+
+    soup = BeautifulSoup(
+        content,
+        features=parser,
+        parse_only=SoupStrainer("div", attrs=LYRICS_CONTAINER),
+    )
+
+    lyrics = []
+
+    for div in soup.find_all("div", attrs=LYRICS_CONTAINER):
+        lyrics.extend(_walk_lyrics(div))
+
+    return "".join(lyrics).replace("е", "e").split("\n")
+
+
+def _conditional_headers(cached: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    headers = {}
+
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    return headers
+
+
+def _lyrics_entry(lines: List[str], headers: Mapping[str, str]) -> Dict[str, Any]:
+    return {
+        "lines": lines,
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+    }
+
+
+def _save_lyrics(cache: Cache, url: str, entry: Dict[str, Any]) -> None:
+    # Pages without lyrics are requested again, instead of caching them.
+    if not any(entry["lines"]):
+        return
+
+    ttl = cache.ttl_of(LYRICS_SERVICE) or LYRICS_MAX_AGE
+    cache.save(LYRICS_SERVICE, entry, ttl=ttl, url=url)
+
+
+def get_lyrics(
+    url: str,
+    attemps_left: int = 3,
+    *,
+    session: Optional[requests.Session] = None,
+    retry: Optional[RetryPolicy] = None,
+    timeout: float | Tuple[float, float] | None = DEFAULT_TIMEOUT,
+    cache: Optional[Cache] = None,
+    stream: bool = False,
+    parse: Callable[[str], List[str]] = _parse_lyrics,
+) -> List[str]:
     """
     Looks for the lyrics of a song in genius.
 
+    When a cache is provided the lines are stored in it, and once they expire
+    (after a week, when the cache has no ttl for them) the page is requested
+    again with its ETag / Last-Modified, so an unchanged page is neither
+    downloaded nor parsed again. Pages without lyrics aren't cached.
+
     Parameters
     ----------
     url: str
         Url of the song in genius.
+    attemps_left: int
+        Maximum attempts to fetch the page, when no retry policy is provided.
+    session: requests.Session
+        Http session to reuse the connections from.
+    retry: genius.retry.RetryPolicy
+        Policy to retry the requests that fail with transient errors.
+    timeout: float | Tuple[float, float]
+        Seconds to wait for the page, either one value or a (connect, read) tuple.
+    cache: genius.cache.Cache
+        Cache where the lyrics are stored.
+    stream: bool
+        Flag to read the page in chunks and stop reading it as soon as the
+        lyrics containers are complete, instead of downloading all of it.
+    parse: Callable[[str], List[str]]
+        Function that extracts the lines of the lyrics from the html of the page.
 
     Returns
     -------
     List[str]:
         Lines of the lyrics.
     """
-
     if not attemps_left:
         return []
 
-    try:
-        soup = _get_soup(f"{url}")
+    retry = retry or RetryPolicy(attempts=attemps_left)
+    cache = cache or Cache()
+
+    cached, expired = cache.lookup(LYRICS_SERVICE, url=url)
 
-        lyrics = []
+    if cached and not expired:
+        return cached["lines"]
 
-        for div in soup.find_all("div", attrs={"data-lyrics-container": "true"}):
-            lyrics += _extract_lyrics(div)
+    try:
+        status, headers, content = retry.call(
+            _get_page,
+            f"{url}",
+            session=session,
+            timeout=timeout,
+            headers=_conditional_headers(cached),
+            stream=stream,
+        )
 
-        return "".join(lyrics).replace("е", "e").split("\n")
+        if cached and status == 304:
+            entry = cached
+        else:
+            entry = _lyrics_entry(parse(content), headers)
     except Exception as exc:
         logger.error("Failed to fetch lyrics: %s", exc)
-        return get_lyrics(url, attemps_left - 1)
+        # Expired lyrics are better than none.
+        return cached["lines"] if cached else []
+
+    _save_lyrics(cache, url, entry)
+
+    return entry["lines"]
@@ -0,0 +1,41 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+# Seconds to wait to establish a connection and between bytes of a response.
+DEFAULT_TIMEOUT = (5, 30)
+
+
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """
+    Create a pooled http session to share between the api and the scraper.
+
+    Parameters
+    ----------
+    pool_connections: int
+        Amount of hosts to keep a connection pool for.
+    pool_maxsize: int
+        Maximum amount of connections to keep open per host.
+    keep_alive: bool
+        Flag to indicate if the connections should be reused between requests.
+
+    Returns
+    -------
+    requests.Session
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
@@ -0,0 +1,65 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key, so only the first one runs
+    and the rest wait for it and receive its result (or its exception).
+    """
+
+    def __init__(self) -> None:
+        self.calls: Dict[str, Future] = {}
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.coalesced: int = 0
+        self.lock = threading.Lock()
+
+    def call(self, key: str, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call a function, unless a call with the same key is already in flight,
+        in which case its result is awaited instead.
+        """
+        with self.lock:
+            future = self.calls.get(key)
+            leader = future is None
+
+            if leader:
+                future = self.calls[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.lock:
+                del self.calls[key]
+
+    async def call_async(
+        self, key: str, function: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """
+        Await a coroutine function, unless a call with the same key is already
+        in flight, in which case its result is awaited instead.
+        """
+        task = self.tasks.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(function(*args, **kwargs))
+            task.add_done_callback(lambda _: self.tasks.pop(key, None))
+            self.tasks[key] = task
+        else:
+            self.coalesced += 1
+
+        # Shielded, so a caller that is cancelled doesn't cancel the others.
+        return await asyncio.shield(task)
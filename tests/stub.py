@@ -0,0 +1,128 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+Route = Callable[[Dict[str, str], Dict[str, str]], Tuple[int, Dict[str, str], bytes]]
+
+
+def artist_data(artist_id: int, name: str = None, **extra) -> Dict[str, Any]:
+    return {
+        "id": artist_id,
+        "name": name or f"Artist {artist_id}",
+        "url": f"https://genius.com/artists/{artist_id}",
+        **extra,
+    }
+
+
+def song_data(song_id: int, title: str = None, artist_id: int = 1, **extra):
+    title = title or f"Song {song_id}"
+
+    return {
+        "id": song_id,
+        "title": title,
+        "title_with_featured": title,
+        "url": f"https://genius.com/songs/{song_id}",
+        "primary_artist": artist_data(artist_id),
+        **extra,
+    }
+
+
+def api_response(response: Dict[str, Any], status: int = 200) -> bytes:
+    return json.dumps(
+        {
+            "meta": {"status": status, "message": "stub"},
+            "response": response,
+        }
+    ).encode()
+
+
+def paged(key: str, pages: List[List[Dict[str, Any]]], delay: float = 0.0) -> Route:
+    def route(params, _):
+        time.sleep(delay)
+
+        page = int(params.get("page", 1))
+        items = pages[page - 1] if page <= len(pages) else []
+
+        return 200, {}, api_response({key: items})
+
+    return route
+
+
+class StubServer:
+    """
+    Local stand-in of genius.com used to run the tests without network access.
+
+    Routes map a path to either a json response for the api, or to a callable
+    that receives the query params and the request headers and returns a tuple
+    with the status, the headers and the body of the response.
+    """
+
+    def __init__(self):
+        self.routes: Dict[str, Any] = {}
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        self.connections: set = set()
+        self.lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                params = dict(parse_qsl(parts.query))
+
+                with stub.lock:
+                    stub.requests.append((parts.path, params))
+                    stub.connections.add(self.client_address)
+
+                status, headers, body = stub.handle(
+                    parts.path, params, dict(self.headers)
+                )
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.05,), daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def handle(self, path, params, headers) -> Tuple[int, Dict[str, str], bytes]:
+        route = self.routes.get(path)
+
+        if route is None:
+            return 404, {}, api_response({}, status=404)
+
+        if callable(route):
+            return route(params, headers)
+
+        return 200, {"Content-Type": "application/json"}, api_response(route)
+
+    def count(self, path: str) -> int:
+        with self.lock:
+            return sum(1 for requested, _ in self.requests if requested == path)
+
+    def __enter__(self) -> "StubServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from unittest import IsolatedAsyncioTestCase, mock, skipIf
+
+from genius.cache import MemoryCache
+from genius.scraper import _parse_lyrics
+from tests.stub import StubServer, api_response, artist_data, song_data
+
+try:
+    from genius.aio import AsyncArtist, AsyncGenius, AsyncSong
+except ImportError:  # pragma: no cover
+    AsyncGenius = None
+
+LYRICS_PAGE = b"""
+<html><body>
+<div data-lyrics-container="true">First line<br/>Second <b>line</b></div>
+</body></html>
+"""
+
+
+@skipIf(AsyncGenius is None, "aiohttp is not installed")
+class AsyncGeniusTest(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+
+    async def asyncSetUp(self) -> None:
+        self.genius = AsyncGenius("token")
+        self.genius.api.BASE_URL = self.server.url
+
+    async def asyncTearDown(self) -> None:
+        await self.genius.close()
+
+    async def test_get_song(self):
+        self.server.routes["/songs/1"] = {"song": song_data(1, "Andromeda")}
+
+        song = await self.genius.get_song(1)
+
+        self.assertIsInstance(song, AsyncSong)
+        self.assertIsInstance(song.artist, AsyncArtist)
+        self.assertEqual(song.title, "Andromeda")
+
+    async def test_awaitable_lazy_properties(self):
+        self.server.routes["/artists/7"] = {"artist": artist_data(7)}
+        self.server.routes["/artists/7/songs"] = lambda params, _: (
+            200,
+            {},
+            api_response({"songs": [song_data(1)] if params["page"] == "1" else []}),
+        )
+        self.server.routes["/songs/1"] = {
+            "song": song_data(1, description={"plain": "stub"})
+        }
+
+        artist = await self.genius.get_artist(7)
+        song = [song async for song in artist.songs][0]
+
+        self.assertFalse(song._fully_loaded_)
+        self.assertEqual(await song.description, "stub")
+        self.assertTrue(song._fully_loaded_)
+        self.assertEqual(await song.artists, [])
+        self.assertEqual(self.server.count("/songs/1"), 1)
+
+    async def test_search_all(self):
+        def search(params, _):
+            page = int(params["page"])
+            songs = [song_data(page)] if page < 3 else []
+            hits = [{"result": song} for song in songs]
+            return 200, {}, api_response({"hits": hits})
+
+        self.server.routes["/search"] = search
+
+        songs = [song async for song in self.genius.search_all("text")]
+
+        self.assertEqual([song.id for song in songs], [1, 2])
+
+    async def test_lyrics(self):
+        self.server.routes["/songs/1"] = {
+            "song": song_data(1, url=f"{self.server.url}/lyrics/1")
+        }
+        self.server.routes["/lyrics/1"] = lambda *_: (200, {}, LYRICS_PAGE)
+
+        song = await self.genius.get_song(1)
+
+        self.assertEqual(await song.lyrics, ["First line", "Second line"])
+
+    async def test_lyrics_are_revalidated(self):
+        def page(_, headers):
+            if headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"'}, b""
+
+            return 200, {"ETag": '"v1"'}, LYRICS_PAGE
+
+        self.server.routes["/songs/1"] = {
+            "song": song_data(1, url=f"{self.server.url}/lyrics/1")
+        }
+        self.server.routes["/lyrics/1"] = page
+        self.genius.api.cache.backend = MemoryCache()
+        self.genius.api.cache.ttl = {"lyrics": -1}
+
+        song = await self.genius.get_song(1)
+
+        with mock.patch("genius.aio._parse_lyrics", wraps=_parse_lyrics) as parse:
+            for _ in range(2):
+                self.assertEqual(await song.lyrics, ["First line", "Second line"])
+
+        parse.assert_called_once()
+        self.assertEqual(self.server.count("/lyrics/1"), 2)
+
+    async def test_concurrent_requests_are_coalesced(self):
+        def artist(*_):
+            time.sleep(0.2)
+            return 200, {}, api_response({"artist": artist_data(7)})
+
+        self.server.routes["/artists/7"] = artist
+
+        artists = await asyncio.gather(*(self.genius.get_artist(7) for _ in range(8)))
+
+        self.assertEqual({artist.id for artist in artists}, {7})
+        self.assertEqual(self.server.count("/artists/7"), 1)
@@ -0,0 +1,602 @@
+import gc
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+import requests
+
+from genius.api import Genius
+from genius.cache import MemoryCache
+from genius.exceptions import APIException, DeadlineExceeded
+from genius.ratelimit import RateLimiter, retry_after
+from genius.results import ResultMode
+from genius.retry import RetryPolicy
+from tests.stub import StubServer, api_response, artist_data, paged, song_data
+
+
+class APITest(TestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+
+        self.genius = Genius("token", rate_limit=None, retry=RetryPolicy(backoff=0.01))
+        self.genius.api.BASE_URL = self.server.url
+        self.addCleanup(self.genius.close)
+
+    def test_session_reuses_connections(self):
+        for song_id in range(1, 6):
+            self.server.routes[f"/songs/{song_id}"] = {"song": song_data(song_id)}
+
+        songs = [self.genius.get_song(song_id) for song_id in range(1, 6)]
+
+        self.assertEqual([song.id for song in songs], [1, 2, 3, 4, 5])
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_lazy_properties_share_session(self):
+        self.server.routes["/songs/1"] = {"song": song_data(1, artist_id=7)}
+        self.server.routes["/artists/7"] = {
+            "artist": artist_data(7, description={"plain": "stub"})
+        }
+
+        song = self.genius.get_song(1)
+
+        self.assertEqual(song.artist.description, "stub")
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_context_manager_closes_session(self):
+        genius = Genius("token")
+
+        with mock.patch.object(genius.api.session, "close") as close:
+            with genius:
+                pass
+
+        close.assert_called_once()
+
+    def test_external_session_is_not_closed(self):
+        session = mock.MagicMock()
+
+        with Genius("token", session=session):
+            pass
+
+        session.close.assert_not_called()
+
+    def test_prefetch_keeps_page_order(self):
+        pages = [
+            [song_data(page * 10 + index) for index in range(3)] for page in range(6)
+        ]
+        route = paged("songs", pages)
+        second_page = threading.Event()
+        overlapped = []
+
+        def songs(params, headers):
+            if params.get("page") == "2":
+                second_page.set()
+
+            # The first page is only answered once the second one is requested.
+            if params.get("page", "1") == "1":
+                overlapped.append(second_page.wait(5))
+
+            return route(params, headers)
+
+        self.server.routes["/artists/1/songs"] = songs
+
+        songs = list(self.genius.get_all_artist_songs(1, prefetch=8))
+
+        expected = [song["id"] for page in pages for song in page]
+        self.assertEqual([song.id for song in songs], expected)
+        self.assertEqual(overlapped, [True])
+
+    def test_prefetch_respects_page_limit(self):
+        pages = [[song_data(page)] for page in range(1, 20)]
+        hits = [[{"result": song} for song in page] for page in pages]
+        self.server.routes["/search"] = paged("hits", hits)
+
+        songs = list(self.genius.search_all("text", page_limit=3, prefetch=5))
+
+        self.assertEqual([song.id for song in songs], [1, 2, 3])
+        self.assertEqual(self.server.count("/search"), 3)
+
+    def test_prefetch_stops_when_consumer_stops(self):
+        pages = [[{"song": song_data(page)}] for page in range(1, 50)]
+        self.server.routes["/albums/1/tracks"] = paged("tracks", pages, delay=0.05)
+
+        songs = self.genius.get_all_album_songs(1, prefetch=2)
+        self.assertEqual(next(songs).id, 1)
+        songs.close()
+
+        time.sleep(0.2)
+        self.assertLessEqual(self.server.count("/albums/1/tracks"), 4)
+
+    def test_get_songs_reports_failures(self):
+        for song_id in [1, 2, 4]:
+            self.server.routes[f"/songs/{song_id}"] = {"song": song_data(song_id)}
+
+        failures = {}
+        songs = self.genius.get_songs(
+            [4, 3, 2, 1],
+            workers=3,
+            on_error=lambda song_id, exc: failures.setdefault(song_id, exc),
+        )
+
+        self.assertEqual([song.id for song in songs], [4, 2, 1])
+        self.assertEqual(list(failures), [3])
+        self.assertEqual(failures[3].status, 404)
+
+    def test_get_artists_as_completed(self):
+        def slow(params, _):
+            time.sleep(0.2)
+            return 200, {}, api_response({"artist": artist_data(1)})
+
+        self.server.routes["/artists/1"] = slow
+        self.server.routes["/artists/2"] = {"artist": artist_data(2)}
+
+        artists = self.genius.get_artists([1, 2], ordered=False)
+
+        self.assertEqual([artist.id for artist in artists], [2, 1])
+
+    def test_get_songs_uses_cache(self):
+        with TemporaryDirectory() as cache_path:
+            genius = Genius("token", cache_path=cache_path, rate_limit=None)
+            genius.api.BASE_URL = self.server.url
+            self.server.routes["/songs/1"] = {"song": song_data(1)}
+
+            genius.get_song(1)
+            songs = list(genius.get_songs([1, 1, 1]))
+
+            self.assertEqual([song.id for song in songs], [1, 1, 1])
+            self.assertEqual(self.server.count("/songs/1"), 1)
+
+    def test_rate_limit(self):
+        self.server.routes["/songs/1"] = {"song": song_data(1)}
+        self.genius.api.limiter = RateLimiter(rate=20)
+
+        start = time.monotonic()
+        for _ in range(6):
+            self.genius.get_song(1)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.25)
+
+    def test_throttled_request(self):
+        responses = [
+            (429, {"Retry-After": "0.3"}, b"Too Many Requests"),
+            (200, {}, api_response({"song": song_data(1)})),
+        ]
+        self.server.routes["/songs/1"] = lambda *_: responses.pop(0)
+        self.genius.api.limiter = limiter = RateLimiter(rate=8)
+
+        start = time.monotonic()
+        self.assertEqual(self.genius.get_song(1).id, 1)
+        self.assertGreaterEqual(time.monotonic() - start, 0.25)
+
+        self.assertEqual(limiter.throttles, 1)
+        self.assertGreater(limiter.current_rate, 4)
+        self.assertEqual(self.genius.api.retry.stats()["retries"], 1)
+
+    def test_throttled_request_without_retries(self):
+        self.server.routes["/songs/1"] = lambda *_: (429, {}, b"Too Many Requests")
+        self.genius.api.limiter = limiter = RateLimiter(rate=8)
+        self.genius.api.retry = RetryPolicy(attempts=1)
+
+        with self.assertRaises(APIException) as context:
+            self.genius.get_song(1)
+
+        self.assertEqual(context.exception.status, 429)
+        self.assertEqual(limiter.current_rate, 4)
+
+    def test_retry_after(self):
+        self.assertEqual(retry_after("2"), 2)
+        self.assertIsNone(retry_after(None))
+        self.assertIsNone(retry_after("soon"))
+        self.assertEqual(retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+
+    def test_retry_transient_errors(self):
+        responses = [
+            (502, {}, b"Bad Gateway"),
+            (500, {}, api_response({}, status=500)),
+            (200, {}, api_response({"song": song_data(1)})),
+        ]
+        self.server.routes["/songs/1"] = lambda *_: responses.pop(0)
+
+        self.assertEqual(self.genius.get_song(1).id, 1)
+        self.assertEqual(self.genius.api.retry.stats()["retries"], 2)
+
+    def test_do_not_retry_client_errors(self):
+        with self.assertRaises(APIException):
+            self.genius.get_song(1)
+
+        self.assertEqual(self.server.count("/songs/1"), 1)
+        self.assertEqual(self.genius.api.retry.stats()["retries"], 0)
+
+    def test_retry_deadline(self):
+        self.server.routes["/songs/1"] = lambda *_: (503, {}, b"Unavailable")
+        self.genius.api.retry = RetryPolicy(attempts=10, backoff=0.2, deadline=0.3)
+
+        with self.assertRaises(APIException):
+            self.genius.get_song(1)
+
+        self.assertLess(self.server.count("/songs/1"), 10)
+
+    def test_timeout(self):
+        def stalled(*_):
+            time.sleep(1)
+            return 200, {}, api_response({"song": song_data(1)})
+
+        self.server.routes["/songs/1"] = stalled
+        self.genius.api.timeout = 0.1
+        self.genius.api.retry = RetryPolicy(attempts=1)
+
+        start = time.monotonic()
+        with self.assertRaises(requests.Timeout):
+            self.genius.get_song(1)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_deadline(self):
+        pages = [[{"result": song_data(page)}] for page in range(1, 11)]
+        self.server.routes["/search"] = paged("hits", pages, delay=0.1)
+
+        songs = []
+        with self.assertRaises(DeadlineExceeded):
+            for song in self.genius.search_all("A", deadline=0.25):
+                songs.append(song.id)
+
+        # Songs retrieved before the deadline are kept, in order.
+        self.assertTrue(0 < len(songs) < 10)
+        self.assertEqual(songs, list(range(1, len(songs) + 1)))
+
+    def test_deadline_partial_results(self):
+        pages = [[song_data(page)] for page in range(1, 11)]
+        self.server.routes["/artists/1/songs"] = paged("songs", pages, delay=0.1)
+
+        for prefetch in [0, 2]:
+            songs = self.genius.get_all_artist_songs(
+                1, prefetch=prefetch, deadline=0.35, partial=True
+            )
+            self.assertLess(len(list(songs)), 10)
+
+    def test_default_deadline(self):
+        pages = [[song_data(page)] for page in range(1, 11)]
+        self.server.routes["/artists/7"] = {"artist": artist_data(7)}
+        self.server.routes["/artists/7/songs"] = paged("songs", pages, delay=0.1)
+        self.genius.deadline = 0.25
+
+        artist = self.genius.get_artist(7)
+
+        with self.assertRaises(DeadlineExceeded):
+            list(artist.songs)
+
+    def lyrics_pages(self, songs):
+        for song_id in range(1, songs + 1):
+            page = (
+                f'<html><body><div data-lyrics-container="true">Song {song_id}'
+                "<br/>Chorus</div></body></html>"
+            )
+            self.server.routes[f"/lyrics/{song_id}"] = lambda *_, page=page: (
+                200,
+                {"Content-Type": "text/html; charset=utf-8"},
+                page.encode(),
+            )
+
+        return [
+            song_data(song_id, url=f"{self.server.url}/lyrics/{song_id}")
+            for song_id in range(1, songs + 1)
+        ]
+
+    def test_artist_lyrics_corpus(self):
+        songs = self.lyrics_pages(12)
+        self.server.routes["/artists/7"] = {"artist": artist_data(7)}
+        self.server.routes["/artists/7/songs"] = paged(
+            "songs", [songs[:5], songs[5:10], songs[10:]]
+        )
+        self.genius.api.cache.backend = MemoryCache()
+
+        artist = self.genius.get_artist(7)
+
+        for processes in [2, 0]:
+            corpus = {
+                song.id: lines
+                for song, lines in artist.lyrics_corpus(workers=4, processes=processes)
+            }
+
+            self.assertEqual(
+                corpus,
+                {song_id: [f"Song {song_id}", "Chorus"] for song_id in range(1, 13)},
+            )
+
+        # The second corpus was read from the cache.
+        self.assertEqual(self.server.count("/lyrics/1"), 1)
+
+    def test_album_lyrics_corpus(self):
+        songs = self.lyrics_pages(3)
+        self.server.routes["/albums/1/tracks"] = paged(
+            "tracks", [[{"song": song} for song in songs]]
+        )
+        album = self.genius._album(
+            {"id": 1, "name": "Album", "url": "", "artist": artist_data(7)}
+        )
+
+        corpus = dict(album.lyrics_corpus(workers=2, processes=0))
+
+        self.assertEqual(sorted(song.id for song in corpus), [1, 2, 3])
+
+    def test_lyrics_corpus_stops_downloads(self):
+        songs = self.lyrics_pages(8)
+
+        for song_id in range(1, 9):
+            route = self.server.routes[f"/lyrics/{song_id}"]
+            self.server.routes[f"/lyrics/{song_id}"] = lambda *args, route=route: (
+                time.sleep(0.1),
+                route(*args),
+            )[1]
+
+        corpus = self.genius.lyrics_corpus(
+            map(self.genius._song, songs), workers=4, processes=1
+        )
+        next(corpus)
+        corpus.close()
+
+        threads = [thread.name for thread in threading.enumerate()]
+        self.assertFalse(any(name.startswith("genius-bulk") for name in threads))
+
+    def test_identity_map(self):
+        self.server.routes["/search"] = paged(
+            "hits", [[{"result": song_data(1)}, {"result": song_data(2)}]]
+        )
+        self.server.routes["/songs/1"] = {
+            "song": song_data(1, description={"plain": "1"})
+        }
+        self.server.routes["/artists/1"] = {
+            "artist": artist_data(1, description={"plain": "stub"})
+        }
+
+        first, second = self.genius.search_all("A")
+
+        self.assertIs(first.artist, second.artist)
+        self.assertEqual(first.artist.description, "stub")
+        self.assertEqual(second.artist.description, "stub")
+        self.assertEqual(self.server.count("/artists/1"), 1)
+
+        # Full data refreshes the objects built from a listing.
+        self.server.routes["/songs/2"] = {
+            "song": song_data(2, stats={"pageviews": 555}, description={"plain": "2"})
+        }
+        self.assertEqual(second.pageviews, 0)
+        self.assertIs(self.genius.get_song(2), second)
+        self.assertEqual(second.pageviews, 555)
+        self.assertEqual(second.description, "2")
+        self.assertEqual(self.server.count("/songs/2"), 1)
+
+        # Objects already loaded are kept as they are.
+        self.assertEqual(first.description, "1")
+        self.server.routes["/songs/1"] = {"song": song_data(1)}
+        self.assertIs(self.genius.get_song(1), first)
+        self.assertEqual(first.description, "1")
+
+    def test_identity_map_is_weak(self):
+        self.server.routes["/songs/1"] = {"song": song_data(1)}
+
+        song = self.genius.get_song(1)
+        self.assertEqual(len(self.genius.identity), 2)
+
+        del song
+        gc.collect()
+
+        self.assertEqual(len(self.genius.identity), 0)
+
+    def test_models_are_compact(self):
+        self.server.routes["/songs/1"] = {
+            "song": song_data(
+                1,
+                album={"id": 1, "name": "A", "url": "", "artist": artist_data(1)},
+                media=[{"provider": "youtube", "type": "video", "url": ""}],
+            )
+        }
+        self.server.routes["/artists/1"] = {
+            "artist": artist_data(1, twitter_name="stub")
+        }
+
+        song = self.genius.get_song(1)
+
+        for instance in [
+            song,
+            song.artist,
+            song.album,
+            song.media["youtube"],
+            song.artist.social_media["twitter"],
+        ]:
+            self.assertFalse(hasattr(instance, "__dict__"), instance)
+
+        self.assertEqual(song.album.name, "A")
+        self.assertEqual(song.artist.social_media["twitter"].handle, "stub")
+
+    def test_song_details_are_built_on_access(self):
+        self.server.routes["/songs/1"] = {
+            "song": song_data(
+                1,
+                album={"id": 5, "name": "A", "url": "", "artist": artist_data(1)},
+                release_date="2017-03-23",
+                song_relationships=[
+                    {"type": "samples", "songs": [song_data(2, artist_id=2)]}
+                ],
+            )
+        }
+
+        song = self.genius.get_song(1)
+        self.assertEqual(len(self.genius.identity), 2)
+
+        samples = song.samples
+        self.assertEqual([sample.id for sample in samples], [2])
+        self.assertIs(song.samples, samples)
+        self.assertEqual(len(self.genius.identity), 4)
+
+        self.assertEqual(song.release_date.year, 2017)
+        self.assertEqual(song.album.id, 5)
+        self.assertEqual(song.covered_by, [])
+
+    def test_raw_results(self):
+        hits = [{"result": song_data(song_id)} for song_id in [1, 2]]
+        self.server.routes["/search"] = paged("hits", [hits])
+
+        songs = list(self.genius.search("A", mode=ResultMode.RAW))
+        self.assertEqual(songs, [hit["result"] for hit in hits])
+
+        songs = list(
+            self.genius.search("A", mode="raw", fields=["id", "primary_artist.id"])
+        )
+        self.assertEqual(songs[0], {"id": 1, "primary_artist.id": 1})
+
+        self.assertEqual(len(self.genius.identity), 0)
+
+    def test_raw_results_are_copies(self):
+        self.server.routes["/search"] = paged("hits", [[{"result": song_data(1)}]])
+        self.genius.api.cache.backend = MemoryCache()
+
+        for fields in [None, ["primary_artist"]]:
+            (song,) = self.genius.search("A", mode=ResultMode.RAW, fields=fields)
+            song["primary_artist"]["name"] = "Changed"
+
+        (song,) = self.genius.search("A", mode=ResultMode.RAW)
+        self.assertEqual(song["primary_artist"]["name"], "Artist 1")
+        self.assertEqual(self.server.count("/search"), 1)
+
+    def test_tuple_results(self):
+        pages = [[song_data(1), song_data(2)], [song_data(3, title="Last")]]
+        self.server.routes["/artists/1/songs"] = paged("songs", pages)
+        self.genius.result_mode = ResultMode.TUPLE
+
+        songs = list(self.genius.get_all_artist_songs(1))
+
+        self.assertEqual([song.id for song in songs], [1, 2, 3])
+        self.assertEqual(songs[2].title, "Last")
+        self.assertEqual(songs[2].primary_artist_name, "Artist 1")
+
+        (song,) = self.genius.get_artist_songs(1, page=2, fields=["title", "hot"])
+        self.assertEqual(song, ("Last", None))
+
+        (song,) = self.genius.get_artist_songs(1, page=2, fields=["id", "id", "class"])
+        self.assertEqual(song._fields, ("id", "_1", "_2"))
+        self.assertEqual(song, (3, 3, None))
+
+        # Models are still used to navigate from the models.
+        self.server.routes["/artists/1"] = {"artist": artist_data(1)}
+        artist = self.genius._artist(artist_data(1))
+        self.assertEqual([song.id for song in artist.songs], [1, 2, 3])
+
+    def test_concurrent_requests_are_coalesced(self):
+        def artist(*_):
+            time.sleep(0.2)
+            return 200, {}, api_response({"artist": artist_data(7)})
+
+        self.server.routes["/artists/7"] = artist
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            artists = list(
+                executor.map(lambda _: self.genius.api.get_artist(7), range(8))
+            )
+
+        self.assertEqual(artists, [artist_data(7)] * 8)
+        self.assertEqual(self.server.count("/artists/7"), 1)
+        self.assertEqual(self.genius.api.flights.coalesced, 7)
+
+    def test_loads_dont_block_other_objects(self):
+        released = threading.Event()
+
+        def slow(*_):
+            released.wait(5)
+            return 200, {}, api_response({"song": song_data(1)})
+
+        self.server.routes["/songs/1"] = slow
+        slow_song = self.genius._song(song_data(1))
+
+        # A song whose lock is shared with the one that's being loaded.
+        song = next(
+            song
+            for song in map(self.genius._song, map(song_data, range(2, 1000)))
+            if song._load_lock() is slow_song._load_lock()
+        )
+        self.server.routes[f"/songs/{song.id}"] = {
+            "song": song_data(song.id, description={"plain": "loaded"})
+        }
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            loading = executor.submit(lambda: slow_song.description)
+
+            while not self.server.count("/songs/1"):
+                time.sleep(0.01)
+
+            self.assertEqual(song.description, "loaded")
+            self.assertFalse(loading.done())
+
+            released.set()
+            loading.result()
+
+    def test_coalesced_requests_share_errors(self):
+        def missing(*_):
+            time.sleep(0.2)
+            return 404, {}, api_response({}, status=404)
+
+        self.server.routes["/artists/7"] = missing
+
+        def get_artist(_):
+            with self.assertRaises(APIException):
+                self.genius.api.get_artist(7)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(get_artist, range(4)))
+
+        self.assertEqual(self.server.count("/artists/7"), 1)
+
+    def test_shared_client_loads_each_object_once(self):
+        def song(song_id):
+            def route(*_):
+                time.sleep(0.05)
+                data = song_data(
+                    song_id,
+                    artist_id=7,
+                    description={"plain": f"song {song_id}"},
+                    writer_artists=[artist_data(100 + song_id)],
+                )
+                return 200, {}, api_response({"song": data})
+
+            return route
+
+        def artist(*_):
+            time.sleep(0.05)
+            data = artist_data(7, description={"plain": "artist"})
+            return 200, {}, api_response({"artist": data})
+
+        for song_id in range(1, 21):
+            self.server.routes[f"/songs/{song_id}"] = song(song_id)
+        self.server.routes["/artists/7"] = artist
+
+        hits = [{"result": song_data(song_id, artist_id=7)} for song_id in range(1, 21)]
+        self.server.routes["/search"] = paged("hits", [hits])
+        songs = list(self.genius.search("A"))
+
+        def read(worker):
+            # Every worker goes through the songs in a different order.
+            ordered = songs[worker % 20 :] + songs[: worker % 20]
+
+            return {
+                song.id: (song.description, song.writers, song.artist.description)
+                for song in ordered
+            }
+
+        api = self.genius.api
+        with mock.patch.object(api, "get_song", wraps=api.get_song) as get_song:
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                results = list(executor.map(read, range(64)))
+
+        self.assertEqual(get_song.call_count, 20)
+        self.assertEqual(self.server.count("/artists/7"), 1)
+
+        for song_id in range(1, 21):
+            self.assertEqual(self.server.count(f"/songs/{song_id}"), 1)
+
+        for result in results:
+            for song_id, (description, writers, artist) in result.items():
+                self.assertEqual(description, f"song {song_id}")
+                self.assertIs(writers, results[0][song_id][1])
+                self.assertEqual([writer.id for writer in writers], [100 + song_id])
+                self.assertEqual(artist, "artist")
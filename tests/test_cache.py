@@ -0,0 +1,342 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+import ddt
+
+from genius.api import Genius, SortingKeys
+from genius.cache import (
+    Cache,
+    FileCache,
+    MemoryCache,
+    RedisCache,
+    SQLiteCache,
+    TieredCache,
+    migrate,
+)
+from genius.codecs import Codec
+from tests.stub import StubServer, api_response, song_data
+
+
+class RedisStandIn:
+    """Stand-in of a redis client, storing the raw bytes like the server would."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.values:
+            return None
+
+        self.values[key] = value.encode() if isinstance(value, str) else value
+        return True
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+@ddt.ddt
+class CacheTest(TestCase):
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def backend(self, name, **limits):
+        if name == "memory":
+            return MemoryCache(**limits)
+        if name == "file":
+            return FileCache(self.directory.name, **limits)
+        if name == "sqlite":
+            backend = SQLiteCache(f"{self.directory.name}/cache.sqlite", **limits)
+            self.addCleanup(backend.close)
+            return backend
+        if name == "redis":
+            return RedisCache(RedisStandIn())
+
+    def test_key_is_canonical(self):
+        self.assertEqual(
+            Cache.key("search", q="A", page=1, per_page=20),
+            Cache.key("search", per_page=20, page=1, q="A"),
+        )
+        self.assertNotEqual(
+            Cache.key("search", q="A", page=1), Cache.key("search", q="B", page=1)
+        )
+        self.assertEqual(
+            Cache.key("artists/1/songs", sort=SortingKeys.TITLE),
+            "artists/1/songs?sort=title",
+        )
+        self.assertEqual(Cache.key("songs/1"), "songs/1")
+
+    @ddt.data("memory", "file", "sqlite", "redis")
+    def test_backend(self, name):
+        cache = Cache(backend=self.backend(name))
+
+        self.assertIsNone(cache.load("search", q="A"))
+
+        cache.save("search", {"hits": ["A"]}, q="A")
+        cache.save("search", {"hits": ["B"]}, q="B")
+
+        self.assertEqual(cache.load("search", q="A"), {"hits": ["A"]})
+        self.assertEqual(cache.load("search", q="B"), {"hits": ["B"]})
+
+        cache.backend.delete(Cache.key("search", q="A"))
+        self.assertIsNone(cache.load("search", q="A"))
+
+    def test_ttl_per_service(self):
+        cache = Cache(backend=MemoryCache(), ttl={"search": 10, "songs/*": 1000})
+
+        self.assertEqual(cache.ttl_of("search"), 10)
+        self.assertEqual(cache.ttl_of("songs/1"), 1000)
+        self.assertIsNone(cache.ttl_of("artists/1"))
+
+        with mock.patch("genius.cache.time.time", return_value=0):
+            cache.save("search", {"hits": []}, q="A")
+            cache.save("songs/1", {"song": {}})
+            cache.save("artists/1", {"artist": {}})
+
+        with mock.patch("genius.cache.time.time", return_value=100):
+            self.assertIsNone(cache.load("search", q="A"))
+            self.assertEqual(cache.load("songs/1"), {"song": {}})
+            self.assertEqual(cache.load("artists/1"), {"artist": {}})
+
+        self.assertEqual(
+            cache.stats(),
+            {"hits": 2, "misses": 1, "expirations": 1, "evictions": 0},
+        )
+
+    @ddt.data("memory", "file", "sqlite")
+    def test_lru_eviction(self, name):
+        cache = Cache(backend=self.backend(name, max_entries=2))
+
+        cache.save("songs/1", {"song": 1})
+        cache.save("songs/2", {"song": 2})
+        cache.load("songs/1")
+        cache.save("songs/3", {"song": 3})
+
+        self.assertEqual(cache.load("songs/1"), {"song": 1})
+        self.assertIsNone(cache.load("songs/2"))
+        self.assertEqual(cache.load("songs/3"), {"song": 3})
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_lfu_eviction(self):
+        cache = Cache(backend=MemoryCache(max_entries=2, policy="lfu"))
+
+        cache.save("songs/1", {"song": 1})
+        cache.save("songs/2", {"song": 2})
+        cache.load("songs/1")
+        cache.load("songs/1")
+        cache.load("songs/2")
+        cache.save("songs/3", {"song": 3})
+
+        self.assertIsNone(cache.load("songs/2"))
+        self.assertEqual(cache.load("songs/1"), {"song": 1})
+
+    def test_max_bytes(self):
+        backend = MemoryCache(max_bytes=200)
+        cache = Cache(backend=backend)
+
+        for song_id in range(10):
+            cache.save(f"songs/{song_id}", {"song": "x" * 50})
+
+        self.assertLessEqual(backend.usage.bytes, 200)
+        self.assertEqual(len(backend.entries), 2)
+
+    def test_memory_returns_copies(self):
+        cache = Cache(backend=TieredCache(MemoryCache(), MemoryCache()))
+        cache.save("songs/1", {"song": {"title": "A"}})
+
+        cache.load("songs/1")["song"]["title"] = "B"
+        self.assertEqual(cache.load("songs/1"), {"song": {"title": "A"}})
+
+    def test_file_evicted_while_reading(self):
+        backend = FileCache(self.directory.name, max_entries=10)
+        backend.set("songs/1", {"song": 1})
+
+        with mock.patch("genius.cache.os.utime", side_effect=FileNotFoundError):
+            self.assertEqual(backend.get("songs/1"), {"song": 1})
+
+    def test_tiered_reads_from_memory(self):
+        storage = FileCache(self.directory.name)
+        cache = Cache(backend=TieredCache(storage, MemoryCache(max_entries=10)))
+
+        cache.save("artists/1", {"artist": 1})
+
+        with mock.patch.object(storage, "get", wraps=storage.get) as get:
+            for _ in range(5):
+                self.assertEqual(cache.load("artists/1"), {"artist": 1})
+
+            get.assert_not_called()
+
+        cache = Cache(backend=TieredCache(storage, MemoryCache(max_entries=10)))
+
+        with mock.patch.object(storage, "get", wraps=storage.get) as get:
+            for _ in range(5):
+                self.assertEqual(cache.load("artists/1"), {"artist": 1})
+
+            get.assert_called_once()
+
+        self.assertEqual(cache.backend.memory_hits, 4)
+
+    def test_memory_ttl(self):
+        memory = MemoryCache(ttl=10)
+
+        with mock.patch("genius.cache.time.monotonic", return_value=0):
+            memory.set("songs/1", {"song": 1})
+
+        with mock.patch("genius.cache.time.monotonic", return_value=5):
+            self.assertEqual(memory.get("songs/1"), {"song": 1})
+
+        with mock.patch("genius.cache.time.monotonic", return_value=20):
+            self.assertIsNone(memory.get("songs/1"))
+
+    @ddt.data(
+        ("json", None),
+        ("json", "zlib"),
+        ("json", "gzip"),
+        ("msgpack", "zlib"),
+    )
+    @ddt.unpack
+    def test_codec(self, serializer, compression):
+        if serializer == "msgpack":
+            try:
+                import msgpack  # noqa: F401
+            except ImportError:
+                self.skipTest("msgpack is not installed")
+
+        codec = Codec(serializer, compression)
+        value = {"song": {"id": 1, "title": "Andromeda", "media": [None, True]}}
+
+        data = codec.encode(value)
+
+        self.assertTrue(data.startswith(codec.header))
+        self.assertEqual(Codec.decode(data), value)
+        self.assertEqual(Codec.decode('{"song": 1}'), {"song": 1})
+
+    @ddt.data("file", "sqlite", "redis")
+    def test_formats_coexist(self, name):
+        backend = self.backend(name)
+        backend.set("songs/1", {"song": 1})
+
+        backend.codec = Codec()
+        backend.set("songs/2", {"song": 2})
+
+        self.assertEqual(backend.get("songs/1"), {"song": 1})
+        self.assertEqual(backend.get("songs/2"), {"song": 2})
+
+    @ddt.data("zlib", "gzip")
+    def test_corrupted_entries_are_misses(self, compression):
+        backend = FileCache(self.directory.name, codec=Codec(compression=compression))
+        backend.set("songs/1", {"song": {"id": 1, "title": "lorem ipsum " * 10}})
+
+        path = backend.file("songs/1")
+        path.write_bytes(path.read_bytes()[:-10])
+
+        with self.assertRaises(ValueError):
+            Codec.decode(path.read_bytes())
+
+        self.assertIsNone(backend.get("songs/1"))
+        self.assertFalse(path.exists())
+
+    def test_migrate(self):
+        legacy = FileCache(self.directory.name)
+        value = {"song": {"id": 1, "description": "lorem ipsum " * 100}}
+
+        for song_id in range(5):
+            legacy.set(f"songs/{song_id}", value)
+
+        size = legacy.file("songs/0").stat().st_size
+
+        self.assertEqual(migrate(self.directory.name), 5)
+        self.assertEqual(migrate(self.directory.name), 0)
+
+        for song_id in range(5):
+            self.assertEqual(legacy.get(f"songs/{song_id}"), value)
+
+        self.assertLess(legacy.file("songs/0").stat().st_size, size / 10)
+
+    def test_search_is_cached_per_query(self):
+        def search(params, _):
+            hits = [{"result": {"id": 1, "q": params["q"]}}]
+            return 200, {}, api_response({"hits": hits})
+
+        with StubServer() as server:
+            server.routes["/search"] = search
+
+            genius = Genius("token", cache_backend=MemoryCache())
+            genius.api.BASE_URL = server.url
+
+            for text in ["A", "B", "A", "B"]:
+                (result,) = genius.api.search(text)
+                self.assertEqual(result["q"], text)
+
+            self.assertEqual(server.count("/search"), 2)
+
+    def test_readers_never_see_partial_writes(self):
+        backend = FileCache(self.directory.name)
+        values = [{"song": str(index) * 200_000} for index in range(5)]
+        backend.set("songs/1", values[0])
+
+        errors = []
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                try:
+                    self.assertIn(backend.get("songs/1"), values)
+                except Exception as exc:  # pragma: no cover
+                    errors.append(exc)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+
+        for _ in range(20):
+            for value in values:
+                backend.set("songs/1", value)
+
+        done.set()
+        for reader in readers:
+            reader.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(list(backend.path.rglob("*.tmp")), [])
+
+    @ddt.data("file", "sqlite", "redis")
+    def test_lock(self, name):
+        backend = self.backend(name)
+
+        with backend.locked("songs/1", timeout=1) as acquired:
+            self.assertTrue(acquired)
+
+            start = time.monotonic()
+            with backend.locked("songs/1", timeout=0.2) as waited:
+                self.assertFalse(waited)
+            self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+        with backend.locked("songs/1", timeout=1) as acquired:
+            self.assertTrue(acquired)
+
+    @ddt.data("file", "sqlite")
+    def test_only_one_writer_fetches(self, name):
+        def song(*_):
+            time.sleep(0.2)
+            return 200, {}, api_response({"song": song_data(1)})
+
+        with StubServer() as server:
+            server.routes["/songs/1"] = song
+
+            def worker(_):
+                # One client per worker, like separate processes would have.
+                genius = Genius("token", cache_backend=self.backend(name))
+                genius.api.BASE_URL = server.url
+                return genius.get_song(1).id
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                self.assertEqual(list(executor.map(worker, range(4))), [1] * 4)
+
+            self.assertEqual(server.count("/songs/1"), 1)
@@ -0,0 +1,111 @@
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from genius.api import Genius
+from genius.graph import Edge, EdgeStore
+from tests.stub import StubServer, song_data
+
+GRAPH = {
+    1: {"samples": [2, 3]},
+    2: {"samples": [4], "covered_by": [5]},
+    3: {"samples": [1]},
+    4: {"samples": [6]},
+    5: {},
+    6: {},
+}
+
+
+def related(song_id):
+    relationships = [
+        {"type": type_, "songs": [song_data(target) for target in targets]}
+        for type_, targets in GRAPH[song_id].items()
+    ]
+
+    return song_data(song_id, song_relationships=relationships)
+
+
+class GraphTest(TestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+
+        for song_id in GRAPH:
+            self.server.routes[f"/songs/{song_id}"] = {"song": related(song_id)}
+
+        self.genius = Genius("token", rate_limit=None)
+        self.genius.api.BASE_URL = self.server.url
+        self.addCleanup(self.genius.close)
+
+    def test_crawl(self):
+        edges = set(self.genius.crawl_relationships([1], max_depth=2, workers=4))
+
+        self.assertEqual(
+            edges,
+            {
+                Edge(1, 2, "samples"),
+                Edge(1, 3, "samples"),
+                Edge(2, 4, "samples"),
+                Edge(2, 5, "covered_by"),
+                Edge(3, 1, "samples"),
+            },
+        )
+
+        for song_id in [1, 2, 3]:
+            self.assertEqual(self.server.count(f"/songs/{song_id}"), 1)
+
+        for song_id in [4, 5, 6]:
+            self.assertEqual(self.server.count(f"/songs/{song_id}"), 0)
+
+    def test_crawl_types(self):
+        edges = set(
+            self.genius.crawl_relationships([1], types=["samples"], max_depth=3)
+        )
+
+        self.assertNotIn(Edge(2, 5, "covered_by"), edges)
+        self.assertIn(Edge(4, 6, "samples"), edges)
+        self.assertEqual(self.server.count("/songs/5"), 0)
+
+    def test_crawl_node_budget(self):
+        edges = list(self.genius.crawl_relationships([1], max_depth=5, max_nodes=3))
+
+        self.assertEqual(
+            sorted(edges),
+            [Edge(1, 2, "samples"), Edge(1, 3, "samples"), Edge(3, 1, "samples")],
+        )
+        self.assertEqual(self.server.count("/songs/4"), 0)
+
+    def test_crawl_errors(self):
+        del self.server.routes["/songs/3"]
+        failed = []
+
+        edges = set(
+            self.genius.crawl_relationships(
+                [1], on_error=lambda song_id, _: failed.append(song_id)
+            )
+        )
+
+        self.assertEqual(failed, [3])
+        self.assertNotIn(Edge(3, 1, "samples"), edges)
+        self.assertIn(Edge(2, 4, "samples"), edges)
+
+    def test_store(self):
+        with TemporaryDirectory() as directory:
+            store = EdgeStore(f"{directory}/graph.sqlite")
+            self.addCleanup(store.close)
+
+            edges = list(self.genius.crawl_relationships([1], store=store))
+
+            # Edges already stored are ignored.
+            store.add(edges)
+
+            self.assertEqual(len(store), 5)
+            self.assertEqual(
+                sorted(store.neighbors(2)),
+                [Edge(2, 4, "samples"), Edge(2, 5, "covered_by")],
+            )
+            self.assertEqual(
+                store.neighbors(2, types=["covered_by"]), [Edge(2, 5, "covered_by")]
+            )
+            self.assertEqual(
+                sorted(store.neighbors(1, reverse=True)), [Edge(3, 1, "samples")]
+            )
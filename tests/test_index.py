@@ -0,0 +1,127 @@
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from genius.api import Genius
+from genius.cache import MemoryCache
+from genius.index import SearchIndex
+from genius.results import ResultMode
+from tests.stub import StubServer, paged, song_data
+
+
+class SearchIndexTest(TestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+
+        self.index = SearchIndex()
+        self.addCleanup(self.index.close)
+
+        self.genius = Genius("token", rate_limit=None, search_index=self.index)
+        self.genius.api.BASE_URL = self.server.url
+        self.addCleanup(self.genius.close)
+
+    def test_responses_are_indexed(self):
+        hits = [
+            {"type": "song", "result": song_data(1, "Andromeda", artist_id=860)},
+            {"type": "song", "result": song_data(2, "Saturnz Barz", artist_id=860)},
+        ]
+        self.server.routes["/search"] = paged("hits", [hits])
+        self.server.routes["/artists/7/songs"] = paged(
+            "songs", [[song_data(3, "Digital Love", artist_id=7)]]
+        )
+
+        list(self.genius.search("gorillaz"))
+        list(self.genius.get_artist_songs(7))
+        self.assertEqual(len(self.index), 3)
+
+        (song,) = self.genius.search("andromeda", source="local")
+        self.assertEqual(song.id, 1)
+        self.assertIs(song, self.genius._song(song_data(1)))
+
+        songs = self.genius.search("artist 860", source="local", mode=ResultMode.RAW)
+        self.assertEqual({song["id"] for song in songs}, {1, 2})
+
+        self.assertEqual(list(self.genius.search("missing", source="local")), [])
+        self.assertEqual(self.server.count("/search"), 1)
+
+    def test_cached_responses_are_indexed(self):
+        backend = MemoryCache()
+        self.server.routes["/songs/1"] = {"song": song_data(1, "Andromeda")}
+        self.server.routes["/search"] = paged("hits", [[{"result": song_data(2)}]])
+
+        genius = Genius("token", rate_limit=None, cache_backend=backend)
+        genius.api.BASE_URL = self.server.url
+        genius.get_song(1)
+        list(genius.search("song"))
+        genius.close()
+
+        self.genius.api.cache.backend = backend
+        self.genius.get_song(1)
+        list(self.genius.search("song"))
+
+        self.assertEqual(len(self.index), 2)
+        (song,) = self.genius.search("andromeda", source="local")
+        self.assertEqual(song.id, 1)
+        self.assertEqual(self.server.count("/songs/1"), 1)
+        self.assertEqual(self.server.count("/search"), 1)
+
+    def test_full_songs_are_kept(self):
+        full = song_data(1, "Andromeda", description={"plain": "Released in 2017"})
+        self.server.routes["/songs/1"] = {"song": full}
+        self.server.routes["/search"] = paged("hits", [[{"result": song_data(1)}]])
+
+        self.genius.get_song(1)
+        list(self.genius.search("song"))
+
+        (song,) = self.genius.search("song", source="local", mode=ResultMode.RAW)
+        self.assertEqual(song["description"], {"plain": "Released in 2017"})
+        self.assertEqual(song["title"], "Song 1")
+
+    def test_lyrics_are_indexed(self):
+        page = (
+            '<html><body><div data-lyrics-container="true">Ground control'
+            "<br/>to Major Tom</div></body></html>"
+        )
+        self.server.routes["/lyrics/1"] = lambda *_: (
+            200,
+            {"Content-Type": "text/html; charset=utf-8"},
+            page.encode(),
+        )
+
+        url = f"{self.server.url}/lyrics/1"
+        self.server.routes["/songs/1"] = {"song": song_data(1, "Oddity", url=url)}
+
+        song = self.genius.get_song(1)
+        self.assertEqual(list(self.genius.search("major tom", source="local")), [])
+
+        self.assertEqual(song.lyrics, ["Ground control", "to Major Tom"])
+        (found,) = self.genius.search("major tom", source="local")
+        self.assertIs(found, song)
+
+    def test_index_persists(self):
+        self.server.routes["/songs/1"] = {"song": song_data(1, "Andromeda")}
+
+        with TemporaryDirectory() as directory:
+            index = SearchIndex(f"{directory}/index.sqlite")
+            genius = Genius("token", rate_limit=None, search_index=index)
+            genius.api.BASE_URL = self.server.url
+            genius.get_song(1)
+            genius.close()
+            index.close()
+
+            index = SearchIndex(f"{directory}/index.sqlite")
+            self.addCleanup(index.close)
+
+            (song,) = index.search("andromeda")
+            self.assertEqual(song["id"], 1)
+
+    def test_query_operators_are_escaped(self):
+        self.index.add({"song": song_data(1, "NOT OR AND")})
+
+        self.assertEqual([song["id"] for song in self.index.search('"NOT OR*')], [1])
+
+    def test_local_search_requires_index(self):
+        genius = Genius("token")
+
+        with self.assertRaises(ValueError):
+            list(genius.search("andromeda", source="local"))
@@ -0,0 +1,141 @@
+from unittest import TestCase, mock
+
+import ddt
+
+from genius.api import Genius
+from genius.cache import MemoryCache
+from genius.resolver import normalize
+from tests.stub import StubServer, api_response, artist_data, paged, song_data
+
+
+def hits(*artists):
+    return [
+        {"result": song_data(index, artist_id=artist_id, primary_artist=artist)}
+        for index, (artist_id, artist) in enumerate(
+            (artist_id, artist_data(artist_id, name)) for artist_id, name in artists
+        )
+    ]
+
+
+@ddt.ddt
+class ResolverTest(TestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+
+        self.backend = MemoryCache()
+        self.genius = self.client()
+
+    def client(self):
+        genius = Genius("token", rate_limit=None, cache_backend=self.backend)
+        genius.api.BASE_URL = self.server.url
+        self.addCleanup(genius.close)
+        return genius
+
+    @ddt.data(
+        ("Beyoncé", "beyonce"),
+        ("  Tyler,   The Creator ", "tylerthecreator"),
+        ("AC/DC", "acdc"),
+        ("Jay-Z", "jayz"),
+        ("Sigur Rós", "sigurros"),
+        ("STRASSE", "strasse"),
+    )
+    @ddt.unpack
+    def test_normalize(self, name, normalized):
+        self.assertEqual(normalize(name), normalized)
+
+    def test_stops_at_first_match(self):
+        self.server.routes["/search"] = paged(
+            "hits",
+            [
+                hits((2, "Jay-Z"), (1, "Beyoncé")),
+                hits((3, "Beyonce Tribute Band")),
+            ],
+        )
+
+        self.assertEqual(self.genius.resolve_artist("beyonce"), 1)
+        self.assertEqual(self.server.count("/search"), 1)
+
+        # Artists seen along the way are already indexed.
+        self.assertEqual(self.genius.resolve_artist("JAY Z"), 2)
+        self.assertEqual(self.server.count("/search"), 1)
+
+    def test_alternate_names(self):
+        self.server.routes["/search"] = paged("hits", [hits((7, "Sean Combs"))])
+        self.server.routes["/artists/7"] = {
+            "artist": artist_data(7, "Sean Combs", alternate_names=["Puff Daddy"])
+        }
+
+        self.assertEqual(self.genius.resolve_artist("puff daddy"), 7)
+        self.assertEqual(self.server.count("/search"), 2)
+        self.assertEqual(self.server.count("/artists/7"), 1)
+
+    def test_names_are_remembered(self):
+        self.server.routes["/search"] = paged("hits", [hits((1, "Gorillaz"))])
+        self.server.routes["/artists/1"] = {"artist": artist_data(1, "Gorillaz")}
+
+        self.assertEqual(self.genius.resolve_artist("Gorillaz"), 1)
+        self.assertIsNone(self.genius.resolve_artist("Unknown"))
+
+        # A new client reads them from the cache, without searching again.
+        genius = self.client()
+        self.assertEqual(genius.resolve_artist("gorillaz"), 1)
+        self.assertIsNone(genius.resolve_artist("unknown"))
+        self.assertEqual(self.server.count("/search"), 3)
+
+    def test_exact_names_are_preferred(self):
+        self.server.routes["/search"] = paged(
+            "hits", [hits((1, "JAY-Z"), (2, "Jay Z"), (3, "Jay Z Tribute"))]
+        )
+
+        self.assertEqual(self.genius.resolve_artist("jay z"), 2)
+
+    def test_ambiguous_names_are_not_remembered(self):
+        self.server.routes["/search"] = paged(
+            "hits", [hits((1, "JAY-Z"), (2, "Jay Z!"))]
+        )
+
+        # The best ranked artist, searched again (from the cache) every time.
+        self.assertEqual(self.genius.resolve_artist("Jay Z"), 1)
+        self.assertEqual(self.genius.resolve_artist("jay-z."), 1)
+        self.assertEqual(self.client().resolve_artist("Jay Z"), 1)
+        self.assertEqual(self.server.count("/search"), 2)
+        self.assertIsNone(self.genius.api.cache.load("artist_names", name="jayz"))
+
+    def test_misses_expire(self):
+        self.server.routes["/search"] = paged("hits", [[]])
+
+        with mock.patch("genius.cache.time.time", return_value=0):
+            self.assertIsNone(self.genius.resolve_artist("Gorillaz"))
+            self.assertIsNone(self.client().resolve_artist("gorillaz"))
+
+        self.assertEqual(self.server.count("/search"), 1)
+        self.server.routes["/search"] = paged("hits", [hits((1, "Gorillaz"))])
+
+        with mock.patch("genius.cache.time.time", return_value=86401):
+            self.assertEqual(self.client().resolve_artist("gorillaz"), 1)
+
+    def test_punctuation_names(self):
+        self.server.routes["/search"] = paged("hits", [hits((7, "!!!"))])
+
+        self.assertEqual(normalize("!!!"), "!!!")
+        self.assertEqual(self.genius.resolve_artist("!!!"), 7)
+        self.assertIsNone(self.genius.resolve_artist(" "))
+        self.assertEqual(self.server.count("/search"), 1)
+
+    def test_resolve_artists(self):
+        def search(params, _):
+            artists = {"daftpunk": (1, "Daft Punk"), "gorillaz": (2, "Gorillaz")}
+            found = artists.get(normalize(params["q"]))
+            return 200, {}, api_response({"hits": hits(found) if found else []})
+
+        self.server.routes["/search"] = search
+
+        names = ["Daft Punk", "gorillaz", "DAFT PUNK", "Missing"]
+        resolved = self.genius.resolve_artists(names, workers=4)
+
+        self.assertEqual(
+            resolved,
+            {"Daft Punk": 1, "gorillaz": 2, "DAFT PUNK": 1, "Missing": None},
+        )
+        self.assertEqual(self.server.count("/search"), 3)
@@ -0,0 +1,237 @@
+from typing import List
+from unittest import TestCase, mock
+
+import ddt
+import requests
+from bs4 import BeautifulSoup, NavigableString
+
+from genius.cache import Cache, MemoryCache
+from genius.retry import RetryPolicy
+from genius.scraper import (
+    LYRICS_CONTAINER,
+    LYRICS_MAX_AGE,
+    _parse_lyrics,
+    _read_lyrics_html,
+    get_lyrics,
+)
+from tests.stub import StubServer
+
+LYRICS_PAGE = """
+<html><body>
+<div data-lyrics-container="true">[Verse 1]<br/>First <i>line</i><br/>Sеcond line</div>
+<div data-lyrics-container="true"><a href="/annotation"><span>Third line</span></a></div>
+</body></html>
+""".encode()
+
+
+PAGES = [
+    LYRICS_PAGE.decode(),
+    "<html><body><p>No lyrics</p></body></html>",
+    """
+    <html><head><script>var a = "<div data-lyrics-container='true'>";</script></head>
+    <body>
+    <div class="header"><h1>Title</h1></div>
+    <div data-lyrics-container="true" class="Lyrics">[Intro]<br>Tom &amp; Jerry&#x27;s
+    <a href="/1"><span class="ref">Line <b>with</b> <i>markup</i></span></a><br>
+    <div><div>Deeply <em>nested</em></div></div><br></div>
+    <div class="ad">Advertisement<br>Not lyrics</div>
+    <div data-lyrics-container="true"></div>
+    <div data-lyrics-container="true">  Spaced   line  <br/><br/>Еnd е</div>
+    <div data-lyrics-container="false">Hidden</div>
+    <script>window.__PRELOADED_STATE__ = {};</script>
+    </body></html>
+    """,
+    '<div data-lyrics-container="true">One\r\nTwo<br/>Three\rFour &#13; x</div>',
+]
+
+STREAMED_PAGE = (
+    "<html><head><title>Song</title></head><body>"
+    '<div id="lyrics-root"><div data-lyrics-container="true">First<br/>Second</div>'
+    '<div class="ad"><img src="ad.png"><br></div>'
+    '<div data-lyrics-container="true"><a href="/1">Third</a></div></div>'
+    '<div class="footer">%s</div><script>var state = "%s";</script>'
+    "</body></html>" % ("<p>Footer</p>" * 1000, "x" * 100_000)
+)
+
+
+def legacy_lyrics(page: str) -> List[str]:
+    """
+    Lines of the lyrics extracted like the scraper used to: parsing the whole
+    page with html.parser and walking the lyrics containers recursively.
+    """
+
+    def extract(current) -> List[str]:
+        if type(current) is NavigableString:
+            return [str(current)]
+
+        if current.name == "br":
+            return ["\n"]
+
+        strings = []
+
+        for children in current.children:
+            strings += extract(children)
+
+        return strings
+
+    soup = BeautifulSoup(page, features="html.parser")
+    lyrics = []
+
+    for div in soup.find_all("div", attrs=LYRICS_CONTAINER):
+        lyrics += extract(div)
+
+    return "".join(lyrics).replace("е", "e").split("\n")
+
+
+def chunked(content, size):
+    for start in range(0, len(content), size):
+        yield content[start : start + size]
+
+
+@ddt.ddt
+class ScraperTest(TestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+        self.addCleanup(self.server.__exit__)
+
+        self.url = f"{self.server.url}/lyrics"
+
+    def test_get_lyrics(self):
+        self.server.routes["/lyrics"] = lambda *_: (200, {}, LYRICS_PAGE)
+
+        self.assertEqual(
+            get_lyrics(self.url),
+            ["[Verse 1]", "First line", "Second lineThird line"],
+        )
+
+    def test_retry_transient_errors(self):
+        responses = [(503, {}, b""), (503, {}, b""), (200, {}, LYRICS_PAGE)]
+        self.server.routes["/lyrics"] = lambda *_: responses.pop(0)
+
+        retry = RetryPolicy(backoff=0.01)
+
+        self.assertEqual(len(get_lyrics(self.url, retry=retry)), 3)
+        self.assertEqual(retry.stats()["retries"], 2)
+
+    def test_attempts_left(self):
+        self.server.routes["/lyrics"] = lambda *_: (503, {}, b"")
+
+        self.assertEqual(get_lyrics(self.url, 1), [])
+        self.assertEqual(get_lyrics(self.url, 0), [])
+        self.assertEqual(self.server.count("/lyrics"), 1)
+
+        with self.assertRaises(TypeError):
+            get_lyrics(self.url, 3, requests.Session())
+
+    def test_missing_page(self):
+        retry = RetryPolicy(backoff=0.01)
+
+        self.assertEqual(get_lyrics(self.url, retry=retry), [])
+        self.assertEqual(self.server.count("/lyrics"), 1)
+
+    @ddt.data(*PAGES)
+    def test_parse_lyrics_matches_full_parse(self, page):
+        expected = legacy_lyrics(page)
+
+        self.assertEqual(_parse_lyrics(page), expected)
+
+        with mock.patch("genius.scraper.PARSER", "html.parser"):
+            self.assertEqual(_parse_lyrics(page), expected)
+
+    def revalidated_page(self):
+        def route(_, headers):
+            if headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"'}, b""
+
+            return 200, {"ETag": '"v1"'}, LYRICS_PAGE
+
+        self.server.routes["/lyrics"] = route
+
+    def test_lyrics_are_cached(self):
+        self.server.routes["/lyrics"] = lambda *_: (200, {}, LYRICS_PAGE)
+        cache = Cache(backend=MemoryCache())
+
+        lyrics = get_lyrics(self.url, cache=cache)
+
+        for _ in range(3):
+            self.assertEqual(get_lyrics(self.url, cache=cache), lyrics)
+
+        self.assertEqual(self.server.count("/lyrics"), 1)
+
+    def test_expired_lyrics_are_revalidated(self):
+        self.revalidated_page()
+        cache = Cache(backend=MemoryCache(), ttl={"lyrics": 10})
+
+        with mock.patch("genius.cache.time.time", return_value=0):
+            lyrics = get_lyrics(self.url, cache=cache)
+
+        with mock.patch("genius.cache.time.time", return_value=100):
+            with mock.patch("genius.scraper._parse_lyrics") as parse:
+                self.assertEqual(get_lyrics(self.url, cache=cache), lyrics)
+
+            parse.assert_not_called()
+
+            # Revalidated lyrics are valid for another ttl.
+            self.assertEqual(get_lyrics(self.url, cache=cache), lyrics)
+
+        self.assertEqual(self.server.count("/lyrics"), 2)
+
+    def test_lyrics_are_revalidated_without_ttl(self):
+        self.revalidated_page()
+        cache = Cache(backend=MemoryCache())
+
+        with mock.patch("genius.cache.time.time", return_value=0):
+            lyrics = get_lyrics(self.url, cache=cache)
+
+        with mock.patch("genius.cache.time.time", return_value=LYRICS_MAX_AGE - 1):
+            self.assertEqual(get_lyrics(self.url, cache=cache), lyrics)
+            self.assertEqual(self.server.count("/lyrics"), 1)
+
+        with mock.patch("genius.cache.time.time", return_value=LYRICS_MAX_AGE + 1):
+            self.assertEqual(get_lyrics(self.url, cache=cache), lyrics)
+            self.assertEqual(self.server.count("/lyrics"), 2)
+
+    def test_empty_lyrics_are_not_cached(self):
+        page = b"<html><body><p>No lyrics</p></body></html>"
+        self.server.routes["/lyrics"] = lambda *_: (200, {}, page)
+        cache = Cache(backend=MemoryCache())
+
+        for _ in range(2):
+            self.assertEqual(get_lyrics(self.url, cache=cache), [""])
+
+        self.assertEqual(self.server.count("/lyrics"), 2)
+
+    def test_expired_lyrics_are_kept_on_errors(self):
+        self.server.routes["/lyrics"] = lambda *_: (200, {}, LYRICS_PAGE)
+        cache = Cache(backend=MemoryCache(), ttl=10)
+
+        with mock.patch("genius.cache.time.time", return_value=0):
+            lyrics = get_lyrics(self.url, cache=cache)
+
+        self.server.routes["/lyrics"] = lambda *_: (503, {}, b"")
+
+        with mock.patch("genius.cache.time.time", return_value=100):
+            retry = RetryPolicy(attempts=1)
+            self.assertEqual(get_lyrics(self.url, retry=retry, cache=cache), lyrics)
+
+    @ddt.data(STREAMED_PAGE, *PAGES)
+    def test_streamed_lyrics_match_full_page(self, page):
+        content = _read_lyrics_html(chunked(page, 64))
+
+        self.assertEqual(_parse_lyrics(content), _parse_lyrics(page))
+
+    def test_stream_stops_after_lyrics(self):
+        chunks = chunked(STREAMED_PAGE, 1024)
+
+        content = _read_lyrics_html(chunks)
+
+        # The lyrics end within the first chunk, the rest is never read.
+        self.assertEqual(len(content), 1024)
+        self.assertGreater(len(list(chunks)), 100)
+
+    def test_get_streamed_lyrics(self):
+        page = STREAMED_PAGE.encode()
+        headers = {"Content-Type": "text/html; charset=utf-8"}
+        self.server.routes["/lyrics"] = lambda *_: (200, headers, page)
+
+        self.assertEqual(get_lyrics(self.url, stream=True), ["First", "SecondThird"])